@@ -3,22 +3,68 @@
 
 import csv
 import json
+import os
 import time
+import typing as t
 from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 
 import click
-import jsonschema
 from tqdm import tqdm
 
 from raillabel_providerkit import export_scenes, validate
+from raillabel_providerkit._util import (
+    iter_scene_files,
+    pool_chunksize,
+    to_json_bytes,
+    write_json_array,
+)
+from raillabel_providerkit.export.export_scenes import ExportFormat
 from raillabel_providerkit.validation.fix_attribute_values import fix_attribute_values
-from raillabel_providerkit.validation.issue import ISSUES_SCHEMA, Issue, IssueIdentifiers
+from raillabel_providerkit.validation.issue import (
+    _ISSUE_VALIDATOR,
+    Issue,
+    IssueIdentifiers,
+    IssueType,
+)
+
+
+@contextmanager
+def _atomic_open(filepath: Path, mode: str, **kwargs: t.Any) -> Iterator[t.IO[t.Any]]:  # noqa: ANN401
+    """Open a temporary file next to filepath and move it there once it is completely written.
+
+    If writing fails, the temporary file is removed and any existing file at filepath is left
+    untouched, so readers never see a partially written file.
+    """
+    part_path = filepath.with_name(filepath.name + ".part")
+    try:
+        with part_path.open(mode, **kwargs) as file:
+            yield file
+        part_path.replace(filepath)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def _atomic_open_binary(filepath: Path) -> Iterator[t.BinaryIO]:
+    """Binary-mode variant of _atomic_open for writers that expect a BinaryIO."""
+    with _atomic_open(filepath, "wb") as file:
+        yield t.cast(t.BinaryIO, file)
 
 
 def store_issues_to_json(issues: list[Issue], filepath: Path) -> None:
     """Store the given issues in a .json file under the given filepath.
 
+    The issues are serialized and written one at a time, so no intermediate list of all
+    serialized issues is built. If the environment variable RAILLABEL_VALIDATE_OUTPUT is set
+    (to anything but "0"), each serialized issue is checked against the issues schema first.
+
     Parameters
     ----------
     issues : list[Issue]
@@ -26,23 +72,32 @@ def store_issues_to_json(issues: list[Issue], filepath: Path) -> None:
     filepath : Path
         The path to the .json file to store the issues in
     """
-    issues_serialized = [issue.serialize() for issue in issues]
-    if not _adheres_to_issues_schema(issues_serialized):
+    check_output = _output_check_enabled()
+    with _atomic_open_binary(filepath) as file:
+        write_json_array(file, (_issue_to_json_bytes(issue, check_output) for issue in issues))
+
+
+def _issue_to_json_bytes(issue: Issue, check_output: bool) -> bytes:
+    if not check_output:
+        return issue.serialize_json_bytes()
+    issue_serialized = issue.serialize()
+    if not _adheres_to_issue_schema(issue_serialized):
         raise AssertionError
-    issues_json = json.dumps(issues_serialized, indent=2)
-    with Path.open(filepath, "w") as file:
-        file.write(issues_json)
+    return to_json_bytes(issue_serialized)
 
 
-def _adheres_to_issues_schema(
-    data: list[dict[str, str | dict[str, str | int] | list[str | int]]],
+def _output_check_enabled() -> bool:
+    return os.environ.get("RAILLABEL_VALIDATE_OUTPUT", "0") not in {"", "0"}
+
+
+def _adheres_to_issue_schema(
+    data: dict[str, str | dict[str, str | int] | list[str | int]],
 ) -> bool:
-    try:
-        jsonschema.validate(data, ISSUES_SCHEMA)
-    except jsonschema.ValidationError:
-        return False
+    return _ISSUE_VALIDATOR.is_valid(data)
 
-    return True
+
+# Issue .csv files are written through a large buffer, so that rows are flushed in big chunks
+_CSV_WRITE_BUFFER_SIZE = 1 << 20
 
 
 def store_issues_to_csv(issues: list[Issue], filepath: Path) -> None:
@@ -54,15 +109,8 @@ def store_issues_to_csv(issues: list[Issue], filepath: Path) -> None:
         The issues to store
     filepath : Path
         The path to the .csv file to store the issues in
-
-    Raises
-    ------
-    TypeError
-        If the issues are malformed after serialization
     """
-    issues_serialized = [issue.serialize() for issue in issues]
-
-    with Path.open(filepath, "w") as file:
+    with _atomic_open(filepath, "w", newline="", buffering=_CSV_WRITE_BUFFER_SIZE) as file:
         writer = csv.writer(file, dialect="excel-tab")
         writer.writerow(
             [
@@ -77,31 +125,7 @@ def store_issues_to_csv(issues: list[Issue], filepath: Path) -> None:
                 "reason",
             ]
         )
-
-        for issue in issues_serialized:
-            issue_type = issue["type"]
-            reason = issue.get("reason", "")
-            if not isinstance(issue_type, str) or not isinstance(reason, str):
-                raise TypeError
-
-            row: list[str | int] = []
-            row.append(issue_type)
-            identifiers = issue["identifiers"]
-            if isinstance(identifiers, dict):
-                row.append(identifiers.get("frame", ""))
-                row.append(identifiers.get("sensor", ""))
-                row.append(identifiers.get("object_type", ""))
-                row.append(identifiers.get("object", ""))
-                row.append(identifiers.get("annotation", ""))
-                row.append(identifiers.get("attribute", ""))
-                row.append("")
-            else:
-                # It's a schema issue, so there are no standard identifiers
-                row.extend(["", "", "", "", "", ""])
-                row.append(str(identifiers))
-            row.append(reason)
-
-            writer.writerow(row)
+        writer.writerows(issue.to_row() for issue in issues)
 
 
 # Time constants for duration formatting
@@ -122,57 +146,123 @@ def _format_duration(seconds: float) -> str:
     return f"{hours}h {remaining_minutes}m {remaining_seconds:.0f}s"
 
 
-def _estimate_duration(num_scenes: int, avg_time_per_scene: float = 1.5) -> str:
+# Rough time a single scene takes to validate, used before any scene has been measured
+_DEFAULT_TIME_PER_SCENE = 1.5
+
+
+def _estimate_duration(num_scenes: int, avg_time_per_scene: float | None = None) -> str:
     """Estimate and format the expected duration for validation.
 
     Parameters
     ----------
     num_scenes : int
         Number of scenes to validate
-    avg_time_per_scene : float
-        Estimated average time per scene in seconds (default: 1.5s)
+    avg_time_per_scene : float | None
+        Average time per scene in seconds. If None, a rough default of 1.5s is assumed.
 
     Returns
     -------
     str
         Formatted estimated duration
     """
+    if avg_time_per_scene is None:
+        avg_time_per_scene = _DEFAULT_TIME_PER_SCENE
     estimated_seconds = num_scenes * avg_time_per_scene
     return _format_duration(estimated_seconds)
 
 
+# Issue types that have attribute details worth showing
+_ATTRIBUTE_ISSUE_TYPES = frozenset(
+    {
+        IssueType.ATTRIBUTE_MISSING.value,
+        IssueType.ATTRIBUTE_VALUE.value,
+        IssueType.ATTRIBUTE_TYPE.value,
+        IssueType.ATTRIBUTE_UNDEFINED.value,
+        IssueType.ATTRIBUTE_SCOPE.value,
+    }
+)
+
+
+@dataclass
+class _ValidationSummary:
+    """Running statistics over all validated scenes.
+
+    Each scene's issues are folded in right after its output has been written, so the issues
+    themselves do not need to be kept until the end of the run.
+    """
+
+    total_issues: int = 0
+    scenes_with_issues: int = 0
+    fixable_count: int = 0
+    issue_type_counter: Counter[str] = field(default_factory=Counter)
+    # Attribute details: {issue_type: {attribute_name: count}}
+    attribute_details: dict[str, Counter[str]] = field(default_factory=dict)
+
+    def add(self, issues: list[Issue]) -> None:
+        """Add the issues of one scene to the summary."""
+        if not issues:
+            return
+        self.scenes_with_issues += 1
+        self.total_issues += len(issues)
+        self.fixable_count += sum(issue.fixable for issue in issues)
+
+        # Counter.update() counts the whole iterable in C instead of one increment per issue
+        issue_types = [issue.type.value for issue in issues]
+        self.issue_type_counter.update(issue_types)
+
+        # Bucket the attribute names by issue type first, so each counter is updated only once
+        attribute_buckets: dict[str, list[str]] = {}
+        for issue_type, issue in zip(issue_types, issues, strict=True):
+            if issue_type not in _ATTRIBUTE_ISSUE_TYPES:
+                continue
+            identifiers = issue.identifiers
+            if not isinstance(identifiers, IssueIdentifiers) or not identifiers.attribute:
+                continue
+            if issue_type not in attribute_buckets:
+                attribute_buckets[issue_type] = []
+            attribute_buckets[issue_type].append(identifiers.attribute)
+
+        for issue_type, attribute_names in attribute_buckets.items():
+            if issue_type not in self.attribute_details:
+                self.attribute_details[issue_type] = Counter()
+            self.attribute_details[issue_type].update(attribute_names)
+
+
 def _print_summary(
-    scene_issues: dict[str, list[Issue]], total_scenes: int, elapsed_time: float, quiet: bool
+    summary: _ValidationSummary,
+    total_scenes: int,
+    elapsed_time: float,
+    quiet: bool,
+    top_k: int = 20,
 ) -> None:
     """Print a summary of all validation issues to the terminal.
 
     Parameters
     ----------
-    scene_issues : dict[str, list[Issue]]
-        Dictionary mapping scene names to their list of issues
+    summary : _ValidationSummary
+        Statistics over the issues of all scenes
     total_scenes : int
         Total number of scenes validated
     elapsed_time : float
         Total time elapsed in seconds
     quiet : bool
         If True, skip printing the summary
+    top_k : int
+        Maximum number of attributes listed per issue type
     """
     if quiet:
         return
 
-    total_issues = sum(len(issues) for issues in scene_issues.values())
-    scenes_with_issues = sum(1 for issues in scene_issues.values() if issues)
-
     click.echo()
     click.echo("=" * 60)
     click.echo("VALIDATION SUMMARY")
     click.echo("=" * 60)
     click.echo(f"Scenes validated: {total_scenes}")
-    click.echo(f"Scenes with issues: {scenes_with_issues}")
-    click.echo(f"Total issues found: {total_issues}")
+    click.echo(f"Scenes with issues: {summary.scenes_with_issues}")
+    click.echo(f"Total issues found: {summary.total_issues}")
     click.echo(f"Time elapsed: {_format_duration(elapsed_time)}")
 
-    if total_issues == 0:
+    if summary.total_issues == 0:
         click.echo()
         click.secho("✓ No issues found!", fg="green", bold=True)
         return
@@ -181,54 +271,25 @@ def _print_summary(
     click.echo("Issues by type:")
     click.echo("-" * 40)
 
-    # Count issues by type across all scenes
-    issue_type_counter: Counter[str] = Counter()
-    for issues in scene_issues.values():
-        for issue in issues:
-            issue_type_counter[issue.type.value] += 1
-
     # Sort by count (descending) and print
-    for issue_type, count in issue_type_counter.most_common():
+    for issue_type, count in summary.issue_type_counter.most_common():
         click.echo(f"  {count:>5}x {issue_type}")
 
     # Print detailed breakdown for attribute-related issues
-    _print_attribute_details(scene_issues)
+    _print_attribute_details(summary.attribute_details, top_k)
 
     # Print fix recommendation if there are fixable issues
-    _print_fix_recommendation(scene_issues)
+    _print_fix_recommendation(summary.fixable_count)
 
     click.echo("=" * 60)
 
 
-def _print_attribute_details(scene_issues: dict[str, list[Issue]]) -> None:
+def _print_attribute_details(attribute_details: dict[str, Counter[str]], top_k: int = 20) -> None:
     """Print detailed breakdown for attribute-related issues.
 
-    Groups issues by type and attribute name for better overview.
+    Groups issues by type and attribute name for better overview. Only the top_k most frequent
+    attributes are listed per issue type.
     """
-    # Issue types that have attribute details worth showing
-    attribute_issue_types = {
-        "AttributeMissing",
-        "AttributeValueIssue",
-        "AttributeTypeIssue",
-        "AttributeUndefined",
-        "AttributeScopeInconsistency",
-    }
-
-    # Collect attribute details: {issue_type: {attribute_name: count}}
-    attribute_details: dict[str, Counter[str]] = {}
-
-    for issues in scene_issues.values():
-        for issue in issues:
-            issue_type = issue.type.value
-            if (
-                issue_type in attribute_issue_types
-                and isinstance(issue.identifiers, IssueIdentifiers)
-                and issue.identifiers.attribute
-            ):
-                if issue_type not in attribute_details:
-                    attribute_details[issue_type] = Counter()
-                attribute_details[issue_type][issue.identifiers.attribute] += 1
-
     # Print details if any found
     if attribute_details:
         click.echo()
@@ -237,18 +298,15 @@ def _print_attribute_details(scene_issues: dict[str, list[Issue]]) -> None:
 
         for issue_type in sorted(attribute_details.keys()):
             click.echo(f"  {issue_type}:")
-            for attr_name, count in attribute_details[issue_type].most_common():
+            attribute_counter = attribute_details[issue_type]
+            for attr_name, count in attribute_counter.most_common(top_k):
                 click.echo(f"      {count:>5}x {attr_name}")
+            if len(attribute_counter) > top_k:
+                click.echo(f"      ... {len(attribute_counter) - top_k} more")
 
 
-def _print_fix_recommendation(scene_issues: dict[str, list[Issue]]) -> None:
+def _print_fix_recommendation(fixable_count: int) -> None:
     """Print a recommendation to use --fix if fixable issues were found."""
-    fixable_count = 0
-    for issues in scene_issues.values():
-        for issue in issues:
-            if issue.fixable:
-                fixable_count += 1
-
     if fixable_count > 0:
         click.echo()
         click.secho(
@@ -301,6 +359,27 @@ def cli() -> None:
     ),
 )
 @click.option("-q", "--quiet", is_flag=True, help="Disable progress bars")
+@click.option(
+    "--skip-empty",
+    is_flag=True,
+    default=False,
+    help="Do not write issue files for scenes without any issues",
+)
+@click.option(
+    "--top-k",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="Maximum number of attributes listed per issue type in the summary",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default="number of CPUs",
+    help="Number of scenes to validate in parallel",
+)
 @click.option(
     "--fix",
     is_flag=True,
@@ -318,6 +397,9 @@ def validate_command(  # noqa: PLR0913
     use_json: bool,
     horizon_tolerance: float,
     quiet: bool,
+    skip_empty: bool,
+    top_k: int,
+    jobs: int,
     fix: bool,
 ) -> None:
     """Check raillabel scenes' annotations for errors."""
@@ -330,6 +412,9 @@ def validate_command(  # noqa: PLR0913
         horizon_tolerance,
         quiet,
         fix,
+        jobs,
+        top_k,
+        skip_empty,
     )
 
 
@@ -342,6 +427,9 @@ def _run_validation(  # noqa: PLR0913
     horizon_tolerance_percent: float,
     quiet: bool,
     fix: bool = False,
+    jobs: int = 1,
+    top_k: int = 20,
+    skip_empty: bool = False,
 ) -> None:
     """Validate all scenes in a folder and output validation results."""
     # Stop early if there is nothing to output
@@ -356,13 +444,12 @@ def _run_validation(  # noqa: PLR0913
     output_folder.mkdir(parents=True, exist_ok=True)
 
     # Get all scenes (.json files) in the folder and subfolders but ignore hidden folders
-    scene_files = list(
-        set(annotations_folder.glob("**/*.json")) - set(annotations_folder.glob(".*/**/*"))
-    )
+    scene_files = list(iter_scene_files(annotations_folder))
 
     # Print estimated duration
     if not quiet:
-        estimated = _estimate_duration(len(scene_files))
+        parallel_scenes = max(1, min(jobs, len(scene_files)))
+        estimated = _estimate_duration(len(scene_files), _DEFAULT_TIME_PER_SCENE / parallel_scenes)
         click.echo(f"Found {len(scene_files)} scene(s) to validate")
         click.echo(f"Estimated duration: ~{estimated}")
         if fix:
@@ -373,7 +460,7 @@ def _run_validation(  # noqa: PLR0913
     start_time = time.time()
 
     # Run validation loop
-    total_fixes_applied, scene_issues = _validate_scene_files(
+    total_fixes_applied, summary = _validate_scene_files(
         scene_files,
         ontology,
         use_csv,
@@ -382,6 +469,8 @@ def _run_validation(  # noqa: PLR0913
         horizon_tolerance_percent,
         quiet,
         fix,
+        jobs,
+        skip_empty,
     )
 
     # Calculate elapsed time
@@ -391,7 +480,7 @@ def _run_validation(  # noqa: PLR0913
         click.echo()
         click.secho(f"Applied {total_fixes_applied} fix(es) to source files.", fg="green", bold=True)
 
-    _print_summary(scene_issues, len(scene_files), elapsed_time, quiet)
+    _print_summary(summary, len(scene_files), elapsed_time, quiet, top_k)
 
 
 def _validate_scene_files(  # noqa: PLR0913
@@ -403,53 +492,138 @@ def _validate_scene_files(  # noqa: PLR0913
     horizon_tolerance_percent: float,
     quiet: bool,
     fix: bool,
-) -> tuple[int, dict[str, list[Issue]]]:
-    """Validate each scene file and return (total_fixes, scene_issues)."""
+    jobs: int = 1,
+    skip_empty: bool = False,
+) -> tuple[int, _ValidationSummary]:
+    """Validate each scene file and return (total_fixes, summary)."""
     total_fixes_applied = 0
-    scene_issues: dict[str, list[Issue]] = {}
-
-    for scene_path in tqdm(scene_files, desc="Validating files", disable=quiet):
-        if fix and ontology is not None:
-            total_fixes_applied += _apply_fixes(scene_path, ontology, quiet)
+    summary = _ValidationSummary()
 
-        issues = validate(
-            scene_path,
-            ontology,
-            horizon_tolerance_percent=horizon_tolerance_percent,
-        )
+    # Once a few scenes are done, replace the rough initial estimate by a measured one
+    num_warmup_scenes = max(3, len(scene_files) // 50)
+    start_time = time.time()
 
-        scene_name = scene_path.name
-        scene_issues[scene_name] = issues
+    results = _iter_validation_results(
+        scene_files, ontology, horizon_tolerance_percent, fix and ontology is not None, jobs
+    )
+    progress = tqdm(
+        results,
+        total=len(scene_files),
+        desc="Validating files",
+        disable=quiet,
+        unit="scene",
+        # Refresh the bar at most twice per second and about 200 times in total
+        mininterval=0.5,
+        miniters=max(1, len(scene_files) // 200),
+        smoothing=0,
+    )
+    for num_scenes_done, (scene_path, issues, fix_descriptions) in enumerate(progress, start=1):
+        total_fixes_applied += len(fix_descriptions)
+        if not quiet:
+            for desc in fix_descriptions:
+                tqdm.write(f"  FIXED [{scene_path.name}]: {desc}")
+
+        if not quiet and num_scenes_done == num_warmup_scenes < len(scene_files):
+            avg_time_per_scene = (time.time() - start_time) / num_warmup_scenes
+            remaining = _estimate_duration(len(scene_files) - num_warmup_scenes, avg_time_per_scene)
+            tqdm.write(f"Estimated remaining: ~{remaining}")
+
+        summary.add(issues)
+        stem = scene_path.stem
+        if skip_empty and not issues:
+            # Remove the files of an earlier run, as they would report issues that are gone
+            (output_folder / f"{stem}.issues.json").unlink(missing_ok=True)
+            (output_folder / f"{stem}.issues.csv").unlink(missing_ok=True)
+            continue
 
         if use_json:
-            store_issues_to_json(issues, output_folder / scene_name.replace(".json", ".issues.json"))
+            store_issues_to_json(issues, output_folder / f"{stem}.issues.json")
         if use_csv:
-            store_issues_to_csv(issues, output_folder / scene_name.replace(".json", ".issues.csv"))
+            store_issues_to_csv(issues, output_folder / f"{stem}.issues.csv")
+
+    return total_fixes_applied, summary
+
+
+def _iter_validation_results(
+    scene_files: list[Path],
+    ontology: Path | None,
+    horizon_tolerance_percent: float,
+    fix: bool,
+    jobs: int,
+) -> Iterator[tuple[Path, list[Issue], list[str]]]:
+    """Yield (scene_path, issues, fix_descriptions) for each scene in order.
+
+    With more than one job, the scenes are validated in a process pool and handed to the workers
+    in chunks. Otherwise they are validated one after the other in this process.
+    """
+    validate_scene_file = partial(
+        _validate_scene_file,
+        ontology=ontology,
+        horizon_tolerance_percent=horizon_tolerance_percent,
+        fix=fix,
+    )
+
+    if jobs <= 1 or len(scene_files) <= 1:
+        for scene_path in scene_files:
+            yield (scene_path, *validate_scene_file(scene_path))
+        return
+
+    max_workers = min(jobs, len(scene_files))
+    chunksize = pool_chunksize(len(scene_files), max_workers)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(validate_scene_file, scene_files, chunksize=chunksize)
+        for scene_path, (issues, fix_descriptions) in zip(scene_files, results, strict=True):
+            yield scene_path, issues, fix_descriptions
+
+
+def _validate_scene_file(
+    scene_path: Path,
+    ontology: Path | None,
+    horizon_tolerance_percent: float,
+    fix: bool,
+) -> tuple[list[Issue], list[str]]:
+    """Optionally fix and then validate a single scene file.
+
+    This is a module-level function so that it can be run in a worker process.
+    """
+    scene_source: dict | Path = scene_path
+    fix_descriptions: list[str] = []
+    if fix and ontology is not None:
+        # Validate the already loaded (and fixed) data instead of parsing the file again
+        scene_data, fix_descriptions = _apply_fixes(scene_path, ontology)
+        if scene_data is not None:
+            scene_source = scene_data
+
+    issues = validate(
+        scene_source,
+        ontology,
+        horizon_tolerance_percent=horizon_tolerance_percent,
+    )
 
-    return total_fixes_applied, scene_issues
+    return issues, fix_descriptions
 
 
-def _apply_fixes(scene_path: Path, ontology: Path, quiet: bool) -> int:
-    """Apply whitespace fixes to a single scene file. Returns number of fixes applied."""
+def _apply_fixes(scene_path: Path, ontology: Path) -> tuple[dict | None, list[str]]:
+    """Apply whitespace fixes to a single scene file.
+
+    Returns the (fixed) scene data, or None if the file does not contain a JSON object, and the
+    descriptions of the fixes applied.
+    """
     with scene_path.open() as f:
         scene_data = json.load(f)
 
     if not isinstance(scene_data, dict):
-        return 0
+        return None, []
 
     fixed_data, fix_descriptions = fix_attribute_values(scene_data, ontology)
 
     if not fix_descriptions:
-        return 0
+        return scene_data, []
 
     with scene_path.open("w") as f:
         json.dump(fixed_data, f, indent=2)
 
-    if not quiet:
-        for desc in fix_descriptions:
-            click.echo(f"  FIXED [{scene_path.name}]: {desc}")
-
-    return len(fix_descriptions)
+    return fixed_data, fix_descriptions
 
 
 @cli.command(name="export")
@@ -470,22 +644,27 @@ def _apply_fixes(scene_path: Path, ontology: Path, quiet: bool) -> int:
     help="Export format(s). Can be specified multiple times for multiple formats.",
 )
 @click.option("-q", "--quiet", is_flag=True, help="Disable progress bars")
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default="number of CPUs",
+    help="Number of scenes to export in parallel",
+)
 def export_command(
     input_folder: Path,
     output_folder: Path,
     formats: tuple[str, ...],
     quiet: bool,
+    jobs: int,
 ) -> None:
     """Export multiple scenes to different formats (JSON, CSV)."""
     if not formats:
         formats = ("json",)
 
-    # Convert tuple to list and cast to ExportFormat list
-    from typing import cast
-
-    from raillabel_providerkit.export.export_scenes import ExportFormat
-
-    format_list = cast(list[ExportFormat], list(formats))
+    # click.Choice guarantees that every entry is a valid ExportFormat
+    format_list = t.cast("list[ExportFormat]", list(formats))
 
     # Start timing
     start_time = time.time()
@@ -497,7 +676,7 @@ def export_command(
         click.echo()
 
     # Export scenes
-    stats = export_scenes(input_folder, output_folder, format_list, quiet)
+    stats = export_scenes(input_folder, output_folder, format_list, quiet, jobs)
 
     # Calculate elapsed time
     elapsed_time = time.time() - start_time
@@ -558,6 +737,27 @@ def export_command(
     help="Tolerance buffer as percentage above horizon (e.g., 10.0 for 10%%). Default is 10.0.",
 )
 @click.option("-q", "--quiet", is_flag=True, help="Disable progress bars")
+@click.option(
+    "--skip-empty",
+    is_flag=True,
+    default=False,
+    help="Do not write issue files for scenes without any issues",
+)
+@click.option(
+    "--top-k",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="Maximum number of attributes listed per issue type in the summary",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default="number of CPUs",
+    help="Number of scenes to validate in parallel",
+)
 @click.option(
     "--fix",
     is_flag=True,
@@ -572,6 +772,9 @@ def run_raillabel_providerkit(  # noqa: PLR0913
     use_json: bool,
     horizon_tolerance: float,
     quiet: bool,
+    skip_empty: bool,
+    top_k: int,
+    jobs: int,
     fix: bool,
 ) -> None:
     """Check a raillabel scene's annotations for errors (legacy command)."""
@@ -584,6 +787,9 @@ def run_raillabel_providerkit(  # noqa: PLR0913
         horizon_tolerance,
         quiet,
         fix,
+        jobs,
+        top_k,
+        skip_empty,
     )
 
 
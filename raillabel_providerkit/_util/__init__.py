@@ -1,6 +1,17 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: MIT
 
+from ._json import to_json_bytes, write_json_array
+from ._parallel import pool_chunksize
+from ._scene_annotations import iter_annotations
+from ._scene_files import iter_scene_files
 from ._sensor_metadata import SENSOR_METADATA
 
-__all__ = ["SENSOR_METADATA"]
+__all__ = [
+    "SENSOR_METADATA",
+    "iter_annotations",
+    "iter_scene_files",
+    "pool_chunksize",
+    "to_json_bytes",
+    "write_json_array",
+]
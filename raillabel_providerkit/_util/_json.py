@@ -0,0 +1,61 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import json
+import typing as t
+from collections.abc import Iterable
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _HAS_ORJSON = False
+
+
+def to_json_bytes(data: t.Any) -> bytes:  # noqa: ANN401
+    """Serialize data to pretty-printed (2-space indented) JSON bytes.
+
+    Uses orjson if it is installed and falls back to the standard library otherwise.
+
+    Parameters
+    ----------
+    data : Any
+        JSON-serializable data (dicts, lists, strings, numbers, booleans and None).
+
+    Returns
+    -------
+    bytes
+        The UTF-8 encoded JSON document.
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def write_json_array(file: t.BinaryIO, items: Iterable[bytes]) -> None:
+    """Write already encoded JSON values to a file as one pretty-printed JSON array.
+
+    The output is identical to to_json_bytes() of the list of decoded values, but the items are
+    written one at a time, so neither the values nor the whole document are held in memory.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        The file to write to.
+    items : Iterable[bytes]
+        The 2-space indented JSON encodings of the array items, as returned by to_json_bytes().
+    """
+    file.write(b"[")
+    separator = b"\n  "
+    is_empty = True
+    for item in items:
+        file.write(separator)
+        # Indent the item by one level, as it is nested in the array. JSON strings never contain
+        # raw newlines, so this only touches the formatting.
+        file.write(item.replace(b"\n", b"\n  "))
+        separator = b",\n  "
+        is_empty = False
+    file.write(b"]" if is_empty else b"\n]")
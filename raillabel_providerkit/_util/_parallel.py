@@ -0,0 +1,29 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+# Upper bound for the number of tasks sent to a worker process at once. Larger chunks save
+# inter-process communication but balance the load worse towards the end of a run.
+_MAX_CHUNKSIZE = 8
+
+
+def pool_chunksize(num_tasks: int, max_workers: int) -> int:
+    """Return the chunksize for mapping num_tasks over a process pool with max_workers.
+
+    Each worker gets about four chunks, so that the load stays balanced, but a chunk never
+    exceeds a small upper bound.
+
+    Parameters
+    ----------
+    num_tasks : int
+        The number of tasks to be mapped.
+    max_workers : int
+        The number of worker processes of the pool.
+
+    Returns
+    -------
+    int
+        The chunksize to pass to Executor.map().
+    """
+    return max(1, min(_MAX_CHUNKSIZE, num_tasks // (max_workers * 4)))
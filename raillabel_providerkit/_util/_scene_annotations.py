@@ -0,0 +1,49 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from uuid import UUID
+
+import raillabel
+from raillabel.format import Bbox, Cuboid, Poly2d, Poly3d, Seg3d
+
+
+def iter_annotations(
+    scene: raillabel.Scene, object_types: Iterable[str] | None = None
+) -> Iterator[tuple[int, UUID, Bbox | Cuboid | Poly2d | Poly3d | Seg3d]]:
+    """Yield the annotations of the scene, optionally only those of certain object types.
+
+    Unlike scene.filter(), this does not copy the scene, so validators that only read a subset of
+    the annotations should prefer it.
+
+    Parameters
+    ----------
+    scene : raillabel.Scene
+        The scene whose annotations are iterated.
+    object_types : Iterable[str] | None, optional
+        If set, only annotations of objects with one of these types are yielded.
+
+    Yields
+    ------
+    tuple[int, UUID, Bbox | Cuboid | Poly2d | Poly3d | Seg3d]
+        The frame id, annotation id and annotation, in frame order.
+    """
+    if object_types is None:
+        for frame_id, frame in scene.frames.items():
+            for annotation_id, annotation in frame.annotations.items():
+                yield frame_id, annotation_id, annotation
+        return
+
+    object_types = frozenset(object_types)
+    object_ids = {
+        object_id for object_id, object_ in scene.objects.items() if object_.type in object_types
+    }
+    if not object_ids:
+        return
+
+    for frame_id, frame in scene.frames.items():
+        for annotation_id, annotation in frame.annotations.items():
+            if annotation.object_id in object_ids:
+                yield frame_id, annotation_id, annotation
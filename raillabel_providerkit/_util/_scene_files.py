@@ -0,0 +1,32 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+
+def iter_scene_files(folder: Path) -> Iterator[Path]:
+    """Yield all scenes (.json files) in the folder and its subfolders, ignoring hidden folders.
+
+    The folder tree is walked once and hidden folders are pruned, so they are never entered.
+
+    Parameters
+    ----------
+    folder : Path
+        The folder to search for scene files.
+
+    Yields
+    ------
+    Path
+        The path of each scene file.
+    """
+    for root, dirs, files in os.walk(folder):
+        # Prune hidden folders in-place, so that os.walk does not descend into them
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        root_path = Path(root)
+        for filename in files:
+            if filename.endswith(".json"):
+                yield root_path / filename
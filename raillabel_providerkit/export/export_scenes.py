@@ -7,20 +7,30 @@ from __future__ import annotations
 
 import csv
 import warnings
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from functools import cache, partial
 from pathlib import Path
 from typing import Literal
 
 import raillabel
 from tqdm import tqdm
 
+from raillabel_providerkit._util import iter_scene_files, pool_chunksize
+
 ExportFormat = Literal["json", "csv"]
 
+# Exported .csv files are written through a large buffer, so that rows are flushed in big chunks
+_CSV_WRITE_BUFFER_SIZE = 1 << 20
+
 
-def export_scenes(  # noqa: C901
+def export_scenes(
     input_folder: Path,
     output_folder: Path,
     formats: list[ExportFormat] | None = None,
     quiet: bool = False,
+    jobs: int = 1,
 ) -> dict[str, int]:
     """Export multiple scenes from a folder to different formats.
 
@@ -35,6 +45,9 @@ def export_scenes(  # noqa: C901
         If None, defaults to ['json'].
     quiet : bool, optional
         If True, disables progress bars. Default is False.
+    jobs : int, optional
+        Number of scenes to export in parallel worker processes. Default is 1, which exports
+        all scenes in the current process.
 
     Returns
     -------
@@ -72,7 +85,7 @@ def export_scenes(  # noqa: C901
     output_folder.mkdir(parents=True, exist_ok=True)
 
     # Find all JSON scene files
-    scene_files = list(set(input_folder.glob("**/*.json")) - set(input_folder.glob(".*/**/*")))
+    scene_files = list(iter_scene_files(input_folder))
 
     if not scene_files:
         return {"total": 0, "exported": 0, "errors": 0}
@@ -81,24 +94,66 @@ def export_scenes(  # noqa: C901
     stats = {"total": len(scene_files), "exported": 0, "errors": 0}
 
     # Process each scene
-    for scene_path in tqdm(scene_files, desc="Exporting scenes", disable=quiet):
-        try:
-            scene = raillabel.load(scene_path)
+    errors = _iter_export_errors(scene_files, output_folder, formats, jobs)
+    for scene_path, error in tqdm(
+        zip(scene_files, errors, strict=True),
+        total=len(scene_files),
+        desc="Exporting scenes",
+        disable=quiet,
+    ):
+        if error is None:
+            stats["exported"] += 1
+            continue
 
-            if "json" in formats:
-                _export_to_json(scene, output_folder, scene_path.name)
+        stats["errors"] += 1
+        if not quiet:
+            warnings.warn(f"Error exporting {scene_path.name}: {error}", stacklevel=2)
 
-            if "csv" in formats:
-                _export_to_csv(scene, output_folder, scene_path.stem)
+    return stats
 
-            stats["exported"] += 1
 
-        except (OSError, ValueError, KeyError) as e:  # noqa: PERF203
-            stats["errors"] += 1
-            if not quiet:
-                warnings.warn(f"Error exporting {scene_path.name}: {e}", stacklevel=2)
+def _iter_export_errors(
+    scene_files: list[Path],
+    output_folder: Path,
+    formats: list[ExportFormat],
+    jobs: int,
+) -> Iterator[str | None]:
+    """Export each scene and yield its error message (None on success) in input order.
+
+    With more than one job, the scenes are exported in a process pool. The errors are only
+    turned into warnings by the caller, as warnings issued in worker processes would be lost.
+    """
+    export_one = partial(_export_one, output_folder=output_folder, formats=formats)
+
+    if jobs <= 1 or len(scene_files) <= 1:
+        yield from map(export_one, scene_files)
+        return
+
+    max_workers = min(jobs, len(scene_files))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(
+            export_one, scene_files, chunksize=pool_chunksize(len(scene_files), max_workers)
+        )
 
-    return stats
+
+def _export_one(scene_path: Path, output_folder: Path, formats: list[ExportFormat]) -> str | None:
+    """Export a single scene and return an error message if this failed.
+
+    This is a module-level function so that it can be run in a worker process.
+    """
+    try:
+        scene = raillabel.load(scene_path)
+
+        if "json" in formats:
+            _export_to_json(scene, output_folder, scene_path.name)
+
+        if "csv" in formats:
+            _export_to_csv(scene, output_folder, scene_path.stem)
+
+    except (OSError, ValueError, KeyError) as e:
+        return str(e)
+
+    return None
 
 
 def _export_to_json(scene: raillabel.Scene, output_folder: Path, filename: str) -> None:
@@ -134,26 +189,32 @@ def _export_to_csv(scene: raillabel.Scene, output_folder: Path, filename_stem: s
     """
     # Export annotations to CSV
     annotations_data = []
+    annotations_fieldnames = {"frame_id", "annotation_id", "annotation_type", "sensor_id"}
 
     for frame_id, frame in scene.frames.items():
         for annotation_id, annotation in frame.annotations.items():
+            annotation_class: type = type(annotation)
+            annotation_type, has_sensor_id, has_attributes = _get_annotation_class_info(
+                annotation_class
+            )
             row = {
                 "frame_id": frame_id,
                 "annotation_id": annotation_id,
-                "annotation_type": annotation.__class__.__name__,
-                "sensor_id": getattr(annotation, "sensor_id", ""),
+                "annotation_type": annotation_type,
+                "sensor_id": annotation.sensor_id if has_sensor_id else "",
             }
 
             # Add type-specific data
-            if hasattr(annotation, "attributes"):
+            if has_attributes:
                 for attr_name, attr_value in annotation.attributes.items():
                     row[f"attr_{attr_name}"] = attr_value
+                    annotations_fieldnames.add(f"attr_{attr_name}")
 
             annotations_data.append(row)
 
     if annotations_data:
         output_path = output_folder / f"{filename_stem}_annotations.csv"
-        _write_csv(annotations_data, output_path)
+        _write_csv(annotations_data, output_path, annotations_fieldnames)
 
     # Export metadata to CSV
     metadata_data = [
@@ -190,7 +251,18 @@ def _export_to_csv(scene: raillabel.Scene, output_folder: Path, filename_stem: s
         _write_csv(sensors_data, sensors_path)
 
 
-def _write_csv(data: list[dict], output_path: Path) -> None:
+@cache
+def _get_annotation_class_info(annotation_class: type) -> tuple[str, bool, bool]:
+    """Return the name of an annotation class and whether it has a sensor_id and attributes.
+
+    This is determined once per class from its dataclass fields (all raillabel annotations are
+    dataclasses) instead of probing every annotation with hasattr().
+    """
+    field_names = {field.name for field in fields(annotation_class)}
+    return annotation_class.__name__, "sensor_id" in field_names, "attributes" in field_names
+
+
+def _write_csv(data: list[dict], output_path: Path, fieldnames: set[str] | None = None) -> None:
     """Write a list of dictionaries to a CSV file.
 
     Parameters
@@ -199,19 +271,23 @@ def _write_csv(data: list[dict], output_path: Path) -> None:
         List of dictionaries to write
     output_path : Path
         Path to the output CSV file
+    fieldnames : set[str] | None, optional
+        All keys occurring in the rows, if already known. If None, they are collected from the
+        rows. Default is None.
     """
     if not data:
         return
 
     # Collect all unique fieldnames across all rows
-    fieldnames: set[str] = set()
-    for row in data:
-        fieldnames.update(row.keys())
+    if fieldnames is None:
+        fieldnames = set()
+        for row in data:
+            fieldnames.update(row.keys())
 
     # Sort fieldnames for consistent output
     fieldnames_sorted = sorted(fieldnames)
 
-    with output_path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames_sorted, restval="")
-        writer.writeheader()
-        writer.writerows(data)
+    with output_path.open("w", newline="", buffering=_CSV_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames_sorted)
+        writer.writerows([row.get(name, "") for name in fieldnames_sorted] for row in data)
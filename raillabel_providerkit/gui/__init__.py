@@ -3,6 +3,16 @@
 
 """GUI package for raillabel-providerkit."""
 
-from .main import launch_gui
+
+def launch_gui() -> None:
+    """Launch the RailLabel Providerkit GUI.
+
+    PyQt6 is only imported once the GUI is launched, so that importing this package (as the
+    validation worker processes do) does not load Qt.
+    """
+    from .main import launch_gui as _launch_gui
+
+    _launch_gui()
+
 
 __all__ = ["launch_gui"]
@@ -0,0 +1,39 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+"""Validation entry point for the GUI worker processes.
+
+This module must not import PyQt6, as it is imported by every worker process.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+from raillabel_providerkit import validate
+from raillabel_providerkit._util import write_json_array
+
+
+def validate_to_json_bytes(scene_path: Path, ontology_path: Path | None) -> tuple[bytes, int]:
+    """Validate a scene and serialize its issues to JSON.
+
+    The issues are serialized in the worker process, so that only the encoded file content has to
+    be sent back to the GUI process instead of the pickled issue objects.
+
+    Parameters
+    ----------
+    scene_path : Path
+        Path to the scene file.
+    ontology_path : Path | None
+        Path to ontology YAML file, or None for no ontology validation
+
+    Returns
+    -------
+    tuple[bytes, int]
+        The JSON encoded issues and the number of issues.
+    """
+    issues = validate(scene_path, ontology_path)
+    payload = io.BytesIO()
+    write_json_array(payload, (issue.serialize_json_bytes() for issue in issues))
+    return payload.getvalue(), len(issues)
@@ -3,8 +3,10 @@
 
 """GUI application for RailLabel Providerkit validation."""
 
+import multiprocessing
 import sys
 import warnings
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 try:
@@ -32,9 +34,12 @@ except ImportError as e:
     )
     raise SystemExit(1) from e
 
-from raillabel_providerkit import list_available_ontologies, validate
+from raillabel_providerkit import list_available_ontologies
+from raillabel_providerkit._util import iter_scene_files
 from raillabel_providerkit.ontologies import get_ontology_path
 
+from ._validation import validate_to_json_bytes
+
 
 class ValidationWorker(QThread):
     """Worker thread for running validation in the background."""
@@ -63,9 +68,7 @@ class ValidationWorker(QThread):
     def run(self) -> None:
         """Run the validation process."""
         try:
-            # Find all JSON files
-            scene_files = list(self.input_folder.glob("**/*.json"))
-            scene_files = [f for f in scene_files if not f.parent.name.startswith(".")]
+            scene_files = list(iter_scene_files(self.input_folder))
 
             if not scene_files:
                 self.error.emit("No JSON files found in the selected folder.")
@@ -76,32 +79,44 @@ class ValidationWorker(QThread):
 
             results = {"total": len(scene_files), "processed": 0, "errors": 0, "issues": 0}
 
-            for i, scene_path in enumerate(scene_files):
-                try:
-                    issues = validate(scene_path, self.ontology_path)
-
-                    # Write results to JSON
-                    output_file = self.output_folder / scene_path.name.replace(
-                        ".json", ".issues.json"
-                    )
-                    import json
+            # Validate the scenes in separate processes, so that all CPU cores are used. The
+            # spawn start method is used, as forking a process with running Qt threads is unsafe.
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = {
+                    executor.submit(
+                        validate_to_json_bytes, scene_path, self.ontology_path
+                    ): scene_path
+                    for scene_path in scene_files
+                }
+                total = len(scene_files)
+                # Report progress about 200 times in total, as every signal is a cross-thread
+                # dispatch and a repaint of the progress bar in the GUI thread.
+                step = max(1, total // 200)
+                for done, future in enumerate(as_completed(futures), start=1):
+                    self._store_result(futures[future], future, results)
+                    if done % step == 0 or done == total:
+                        self.progress.emit(done, total)
 
-                    with output_file.open("w") as f:
-                        json.dump([issue.serialize() for issue in issues], f, indent=2)
+            self.finished.emit(results)
 
-                    results["processed"] += 1
-                    results["issues"] += len(issues)
+        except (OSError, ValueError) as e:
+            self.error.emit(str(e))
 
-                except (OSError, ValueError, KeyError) as e:
-                    results["errors"] += 1
-                    warnings.warn(f"Error processing {scene_path}: {e}", stacklevel=2)
+    def _store_result(self, scene_path: Path, future: Future, results: dict) -> None:
+        """Write the issues of a validated scene to disk and update the results."""
+        try:
+            payload, issue_count = future.result()
 
-                self.progress.emit(i + 1, len(scene_files))
+            # Write results to JSON
+            output_file = self.output_folder / f"{scene_path.stem}.issues.json"
+            output_file.write_bytes(payload)
 
-            self.finished.emit(results)
+            results["processed"] += 1
+            results["issues"] += issue_count
 
-        except (OSError, ValueError) as e:
-            self.error.emit(str(e))
+        except (OSError, ValueError, KeyError) as e:
+            results["errors"] += 1
+            warnings.warn(f"Error processing {scene_path}: {e}", stacklevel=2)
 
 
 class RailLabelGUI(QMainWindow):
@@ -284,7 +299,6 @@ class RailLabelGUI(QMainWindow):
         """Update progress bar."""
         self.progress_bar.setMaximum(total)
         self.progress_bar.setValue(current)
-        self.log(f"Processing: {current}/{total}")
 
     def on_finished(self, results: dict) -> None:
         """Handle validation completion."""
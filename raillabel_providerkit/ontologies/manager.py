@@ -16,11 +16,28 @@ All ontology files are stored centrally in the config/ontologies/ directory.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 import raillabel
 
+_ONTOLOGY_FILES: dict[str, str] = {
+    "osdar26": "osdar26.yaml",
+    "automatedtrain": "automatedtrain.yaml",
+    "osdar23": "osdar23.yaml",
+}
+
+_SCHEMA_FILES: dict[str, str] = {
+    "raillabel": "raillabel_schema.json",
+    "osdar23": "osdar23_schema.json",
+    "osdar26": "osdar26_schema.json",
+    "automatedtrain": "automatedtrain_schema.json",
+    "understand_ai_t4": "understand_ai_t4_schema.json",
+    "ontology": "ontology_schema_v2.yaml",
+}
 
+
+@lru_cache(maxsize=1)
 def _get_config_dir() -> Path:
     """Get the path to the config directory.
 
@@ -38,6 +55,7 @@ def _get_config_dir() -> Path:
     return config_dir
 
 
+@lru_cache(maxsize=32)
 def get_ontology_path(ontology_name: str) -> Path:
     """Get the path to a built-in ontology file.
 
@@ -59,20 +77,14 @@ def get_ontology_path(ontology_name: str) -> Path:
     ValueError
         If the ontology name is not recognized
     """
-    valid_ontologies = {
-        "osdar26": "osdar26.yaml",
-        "automatedtrain": "automatedtrain.yaml",
-        "osdar23": "osdar23.yaml",
-    }
-
-    if ontology_name not in valid_ontologies:
+    if ontology_name not in _ONTOLOGY_FILES:
         msg = (
             f"Unknown ontology '{ontology_name}'. "
-            f"Supported ontologies: {', '.join(valid_ontologies.keys())}"
+            f"Supported ontologies: {', '.join(_ONTOLOGY_FILES.keys())}"
         )
         raise ValueError(msg)
 
-    ontology_file = valid_ontologies[ontology_name]
+    ontology_file = _ONTOLOGY_FILES[ontology_name]
     ontology_path = _get_config_dir() / "ontologies" / ontology_file
 
     if not ontology_path.exists():
@@ -82,6 +94,7 @@ def get_ontology_path(ontology_name: str) -> Path:
     return ontology_path
 
 
+@lru_cache(maxsize=32)
 def get_schema_path(schema_name: str) -> Path:
     """Get the path to a built-in schema file.
 
@@ -112,23 +125,14 @@ def get_schema_path(schema_name: str) -> Path:
     identical copies of the base raillabel schema, as they share the same OpenLABEL
     structure. Ontology-specific validation is handled by the ontology YAML files.
     """
-    valid_schemas = {
-        "raillabel": "raillabel_schema.json",
-        "osdar23": "osdar23_schema.json",
-        "osdar26": "osdar26_schema.json",
-        "automatedtrain": "automatedtrain_schema.json",
-        "understand_ai_t4": "understand_ai_t4_schema.json",
-        "ontology": "ontology_schema_v2.yaml",
-    }
-
-    if schema_name not in valid_schemas:
+    if schema_name not in _SCHEMA_FILES:
         msg = (
             f"Unknown schema '{schema_name}'. "
-            f"Supported schemas: {', '.join(valid_schemas.keys())}"
+            f"Supported schemas: {', '.join(_SCHEMA_FILES.keys())}"
         )
         raise ValueError(msg)
 
-    schema_file = valid_schemas[schema_name]
+    schema_file = _SCHEMA_FILES[schema_name]
     schema_path = _get_config_dir() / "schemas" / schema_file
 
     if not schema_path.exists():
@@ -146,7 +150,7 @@ def list_available_ontologies() -> list[str]:
     list[str]
         List of available ontology names
     """
-    return ["osdar26", "automatedtrain", "osdar23"]
+    return list(_ONTOLOGY_FILES)
 
 
 def list_available_schemas() -> list[str]:
@@ -157,7 +161,7 @@ def list_available_schemas() -> list[str]:
     list[str]
         List of available schema names
     """
-    return ["raillabel", "osdar23", "osdar26", "automatedtrain", "understand_ai_t4", "ontology"]
+    return list(_SCHEMA_FILES)
 
 
 _UNIQUE_CLASSES: dict[str, set[str]] = {
@@ -8,6 +8,8 @@ from uuid import UUID
 
 import jsonschema
 
+from raillabel_providerkit._util import to_json_bytes
+
 
 class IssueType(Enum):
     """General classification of the issue."""
@@ -38,7 +40,7 @@ class IssueType(Enum):
         return [type_.value for type_ in cls]
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueIdentifiers:
     """Information for locating an issue."""
 
@@ -106,7 +108,7 @@ class IssueIdentifiers:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """An error that was found inside the scene."""
 
@@ -138,6 +140,45 @@ class Issue:
             }
         )
 
+    def serialize_json_bytes(self) -> bytes:
+        """Serialize the Issue into pretty-printed (2-space indented) JSON bytes.
+
+        Returns
+        -------
+        bytes
+            The UTF-8 encoded JSON of the serialized Issue
+        """
+        return to_json_bytes(self.serialize())
+
+    def to_row(self) -> tuple[str | int, ...]:
+        """Convert the Issue into a flat row for tabular output formats like .csv.
+
+        The columns are issue_type, frame, sensor, object_type, object, annotation, attribute,
+        schema_path and reason. Fields that are not set are empty strings.
+
+        Returns
+        -------
+        tuple[str | int, ...]
+            The Issue as a row of 9 values
+        """
+        identifiers = self.identifiers
+        reason = self.reason if self.reason is not None else ""
+        if not isinstance(identifiers, IssueIdentifiers):
+            # It's a schema issue, so there are no standard identifiers
+            return (self.type.value, "", "", "", "", "", "", str(identifiers), reason)
+
+        return (
+            self.type.value,
+            identifiers.frame if identifiers.frame is not None else "",
+            identifiers.sensor if identifiers.sensor is not None else "",
+            identifiers.object_type if identifiers.object_type is not None else "",
+            str(identifiers.object) if identifiers.object is not None else "",
+            str(identifiers.annotation) if identifiers.annotation is not None else "",
+            identifiers.attribute if identifiers.attribute is not None else "",
+            "",
+            reason,
+        )
+
     @classmethod
     def deserialize(
         cls, serialized_issue: dict[str, str | dict[str, str | int] | list[str | int]]
@@ -220,11 +261,25 @@ ISSUES_SCHEMA = {
 }
 
 
+# The schemas are static, so their validators are compiled once instead of on every call
+_ISSUE_VALIDATOR = jsonschema.Draft202012Validator(
+    cast(dict[str, Any], ISSUES_SCHEMA["definitions"])["issue"]
+)
+_IDENTIFIERS_VALIDATOR = jsonschema.Draft202012Validator(
+    cast(dict[str, Any], ISSUES_SCHEMA["definitions"])["issue"]["properties"]["identifiers"]
+)
+
+
 def _verify_issue_schema(d: dict) -> None:
-    schema = cast(dict[str, Any], ISSUES_SCHEMA["definitions"])
-    jsonschema.validate(d, schema["issue"])
+    _raise_best_error(_ISSUE_VALIDATOR, d)
 
 
 def _verify_identifiers_schema(d: dict) -> None:
-    schema = cast(dict[str, Any], ISSUES_SCHEMA["definitions"])
-    jsonschema.validate(d, schema["issue"]["properties"]["identifiers"])
+    _raise_best_error(_IDENTIFIERS_VALIDATOR, d)
+
+
+def _raise_best_error(validator: jsonschema.protocols.Validator, d: dict) -> None:
+    """Raise the most relevant validation error, like jsonschema.validate() does."""
+    error = jsonschema.exceptions.best_match(validator.iter_errors(d))
+    if error is not None:
+        raise error
@@ -3,54 +3,44 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import dataclasses
+from collections.abc import Callable
+from functools import cache, lru_cache
 from typing import Any, Literal, cast
 from uuid import UUID
 
 import raillabel
 
+from raillabel_providerkit._util import iter_annotations
 from raillabel_providerkit.validation.issue import Issue, IssueIdentifiers, IssueType
 
 # Mapping:
 # - camera: Bbox, Poly2d (for tracks/transitions)
 # - lidar: Cuboid, Poly3d (for tracks), Seg3d (for segmentation)
 # - radar: Bbox and Cuboid
-_ALLOWED_BY_SENSOR_TYPE: dict[str, tuple[str, ...]] = {
-    "camera": ("Bbox", "Poly2d"),
-    "lidar": ("Cuboid", "Poly3d", "Seg3d"),
-    "radar": ("Bbox", "Cuboid"),
+_ALLOWED_BY_SENSOR_TYPE: dict[str, frozenset[str]] = {
+    "camera": frozenset({"Bbox", "Poly2d"}),
+    "lidar": frozenset({"Cuboid", "Poly3d", "Seg3d"}),
+    "radar": frozenset({"Bbox", "Cuboid"}),
 }
 
 
+_KNOWN_ANNO_TYPES = frozenset({"Bbox", "Cuboid", "Poly2d", "Poly3d", "Num", "Seg3d"})
+_TYPE_NORMALIZATION: dict[str, str] = {t.lower(): t for t in _KNOWN_ANNO_TYPES}
+
+
 def _normalize_anno_type(t: str) -> str:
-    t_low = (t or "").strip().lower()
-    mapping = {
-        "bbox": "Bbox",
-        "cuboid": "Cuboid",
-        "poly2d": "Poly2d",
-        "poly3d": "Poly3d",
-        "num": "Num",
-        "seg3d": "Seg3d",
-    }
-    return mapping.get(t_low, t if t else "")
-
-
-def _iter_annotations(scene: raillabel.Scene) -> Iterable[tuple[int, Any]]:
-    """Iterate over all annotations in the scene."""
-    frames = getattr(scene, "frames", {}) or {}
-    for frame_id, frame in getattr(frames, "items", lambda: frames.items())():
-        annotations = getattr(frame, "annotations", {}) or {}
-        for anno in annotations.values():
-            yield frame_id, anno
+    if t in _KNOWN_ANNO_TYPES:
+        return t
+    if not t:
+        return ""
+    return _TYPE_NORMALIZATION.get(t.strip().lower(), t)
 
 
 def _get_annotation_id(anno: object) -> UUID | None:
     return getattr(anno, "id", None)
 
 
-_KNOWN_ANNO_TYPES = {"Bbox", "Cuboid", "Poly2d", "Poly3d", "Num", "Seg3d"}
-
-
 def _get_annotation_type(anno: object) -> str | None:
     # raillabel annotations encode the type as the class name (Bbox, Poly2d, …).
     class_name = type(anno).__name__
@@ -63,6 +53,9 @@ def _get_annotation_type(anno: object) -> str | None:
     return _normalize_anno_type(str(t))
 
 
+_LIST_OR_TUPLE = (list, tuple)
+
+
 def _get_sensor_id_from_annotation(anno: object) -> str | None:
     # 1) coordinate.sensor / coordinate.sensor_id
     coord = getattr(anno, "coordinate", None)
@@ -79,7 +72,7 @@ def _get_sensor_id_from_annotation(anno: object) -> str | None:
 
     # 3) coordinates-Collection
     coords = getattr(anno, "coordinates", None)
-    if isinstance(coords, list | tuple):
+    if isinstance(coords, _LIST_OR_TUPLE):
         for c in coords:
             sid = getattr(c, "sensor", None) or getattr(c, "sensor_id", None)
             if sid:
@@ -88,15 +81,46 @@ def _get_sensor_id_from_annotation(anno: object) -> str | None:
     return None
 
 
-def _sensor_type(scene: raillabel.Scene, sensor_id: str) -> str | None:
-    """Return the sensor type ('camera', 'lidar', 'radar') or None if unknown."""
+def _get_sensor_id_field(anno: Any) -> str | None:  # noqa: ANN401
+    sid = anno.sensor_id
+    return str(sid) if sid else None
+
+
+@cache
+def _get_sensor_id_extractor(cls: type) -> Callable[[Any], str | None]:
+    """Return the cheapest sensor id extractor for annotations of this class.
+
+    raillabel annotations are dataclasses whose only sensor reference is the sensor_id field, so
+    they can skip the generic attribute probing.
+    """
+    if dataclasses.is_dataclass(cls):
+        field_names = {field.name for field in dataclasses.fields(cls)}
+        if "sensor_id" in field_names and field_names.isdisjoint(
+            ("coordinate", "sensor", "coordinates")
+        ):
+            return _get_sensor_id_field
+    return _get_sensor_id_from_annotation
+
+
+def _sensor_type_map(scene: raillabel.Scene) -> dict[str, str]:
+    """Return the sensor type ('camera', 'lidar', 'radar') of every typed sensor by its id."""
     sensors = getattr(scene, "sensors", {}) or {}
-    sensor = sensors.get(sensor_id)
-    if sensor is None:
-        return None
-    # raillabel sensors use a class-level TYPE attribute (e.g. Camera.TYPE = "camera")
-    s_type = getattr(sensor, "TYPE", None) or getattr(sensor, "type", None)
-    return str(s_type).lower() if s_type else None
+    sensor_types: dict[str, str] = {}
+    for sensor_id, sensor in sensors.items():
+        # raillabel sensors use a class-level TYPE attribute (e.g. Camera.TYPE = "camera")
+        s_type = getattr(sensor, "TYPE", None) or getattr(sensor, "type", None)
+        if s_type:
+            sensor_types[sensor_id] = str(s_type).lower()
+    return sensor_types
+
+
+@lru_cache(maxsize=64)
+def _mismatch_reason(a_type: str, s_type: str) -> str:
+    allowed = _ALLOWED_BY_SENSOR_TYPE[s_type]
+    return (
+        f"Annotation type '{a_type}' not allowed for sensor type '{s_type}'. "
+        f"Allowed types: {', '.join(sorted(allowed))}."
+    )
 
 
 def validate_annotation_type_per_sensor(scene: raillabel.Scene) -> list[Issue]:
@@ -106,22 +130,29 @@ def validate_annotation_type_per_sensor(scene: raillabel.Scene) -> list[Issue]:
         List of Issues if mismatches are found.
     """
     issues: list[Issue] = []
-
-    for frame_id, anno in _iter_annotations(scene):
+    # Sensor id -> (sensor type, allowed annotation types) for every sensor with restrictions.
+    allowed_by_sensor: dict[str, tuple[str, frozenset[str]]] = {}
+    for typed_sensor_id, s_type in _sensor_type_map(scene).items():
+        allowed = _ALLOWED_BY_SENSOR_TYPE.get(s_type)
+        if allowed:
+            allowed_by_sensor[typed_sensor_id] = (s_type, allowed)
+
+    for frame_id, _, anno in iter_annotations(scene):
         a_type = _get_annotation_type(anno)
         if not a_type:
             continue
 
-        sensor_id = _get_sensor_id_from_annotation(anno)
+        anno_class: type = type(anno)
+        sensor_id: str | None = _get_sensor_id_extractor(anno_class)(anno)
         if not sensor_id:
             continue
 
-        s_type = _sensor_type(scene, sensor_id)
-        if not s_type:
+        sensor_entry = allowed_by_sensor.get(sensor_id)
+        if sensor_entry is None:
             continue
 
-        allowed = _ALLOWED_BY_SENSOR_TYPE.get(s_type, ())
-        if allowed and a_type not in allowed:
+        s_type, allowed = sensor_entry
+        if a_type not in allowed:
             issue = Issue(
                 type=IssueType.ANNOTATION_SENSOR_MISMATCH,
                 identifiers=IssueIdentifiers(
@@ -133,10 +164,7 @@ def validate_annotation_type_per_sensor(scene: raillabel.Scene) -> list[Issue]:
                         a_type,
                     ),
                 ),
-                reason=(
-                    f"Annotation type '{a_type}' not allowed for sensor type '{s_type}'. "
-                    f"Allowed types: {', '.join(allowed) if allowed else 'n/a'}."
-                ),
+                reason=_mismatch_reason(a_type, s_type),
             )
             issues.append(issue)
 
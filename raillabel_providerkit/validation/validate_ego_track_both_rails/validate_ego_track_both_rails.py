@@ -10,6 +10,10 @@ from raillabel.format import Camera, Poly2d
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
 
+# Legacy attributes identifying the track of an annotation and their values for the ego track
+_TRACK_ID_KEYS = ("trackID", "trackId", "TrackID", "onTrack")
+_TRACK_ID_EGO_VALUES = frozenset({0, "0", "ego_track"})
+
 
 def validate_ego_track_both_rails(scene: raillabel.Scene) -> list[Issue]:
     """Validate that ego track has both left and right rails in center cameras.
@@ -37,54 +41,50 @@ def validate_ego_track_both_rails(scene: raillabel.Scene) -> list[Issue]:
         return issues
 
     for frame_uid, frame in scene.frames.items():
+        # Group the frame's poly2ds by sensor once, instead of scanning all annotations per camera
+        poly2ds_by_sensor = _group_poly2ds_by_sensor(frame)
         for camera_uid in center_cameras:
-            camera_issues = _validate_frame_for_camera(frame_uid, frame, camera_uid, scene)
-            issues.extend(camera_issues)
+            left_rails, right_rails = _collect_ego_track_rails(
+                poly2ds_by_sensor.get(camera_uid, []), scene
+            )
+            issues.extend(_check_rail_issues(frame_uid, camera_uid, left_rails, right_rails))
 
     return issues
 
 
 def _get_center_camera_uids(sensors: dict) -> list[str]:
     """Return UIDs of center/middle cameras."""
-    center_cameras = []
-    for sensor_uid, sensor in sensors.items():
-        if isinstance(sensor, Camera) and ("center" in sensor_uid or "middle" in sensor_uid):
-            center_cameras.append(sensor_uid)
-    return center_cameras
+    return [
+        sensor_uid
+        for sensor_uid, sensor in sensors.items()
+        if isinstance(sensor, Camera) and ("center" in sensor_uid or "middle" in sensor_uid)
+    ]
 
 
-def _validate_frame_for_camera(
-    frame_uid: int,
-    frame: raillabel.format.Frame,
-    camera_uid: str,
-    scene: raillabel.Scene,
-) -> list[Issue]:
-    """Validate ego track rails for a specific camera in a frame."""
-    left_rails, right_rails = _collect_ego_track_rails(frame, camera_uid, scene)
-    return _check_rail_issues(frame_uid, camera_uid, left_rails, right_rails)
+def _group_poly2ds_by_sensor(frame: raillabel.format.Frame) -> dict[str | None, list[Poly2d]]:
+    """Group the poly2d annotations of a frame by their sensor."""
+    poly2ds_by_sensor: dict[str | None, list[Poly2d]] = {}
+    for annotation in frame.annotations.values():
+        if isinstance(annotation, Poly2d):
+            poly2ds_by_sensor.setdefault(annotation.sensor_id, []).append(annotation)
+    return poly2ds_by_sensor
 
 
 def _collect_ego_track_rails(
-    frame: raillabel.format.Frame,
-    camera_uid: str,
+    poly2ds: list[Poly2d],
     scene: raillabel.Scene,
 ) -> tuple[list[Poly2d], list[Poly2d]]:
-    """Collect left and right ego track rails for a camera."""
+    """Collect left and right ego track rails from the poly2ds of a camera."""
     left_rails: list[Poly2d] = []
     right_rails: list[Poly2d] = []
 
-    for annotation in frame.annotations.values():
-        if annotation.sensor_id != camera_uid:
-            continue
-        if not isinstance(annotation, Poly2d):
-            continue
-        if not _annotation_is_ego_track(annotation, scene):
-            continue
-
+    for annotation in poly2ds:
+        # The rail side is checked first, as it is cheaper than the ego track check
         rail_side = annotation.attributes.get("railSide")
         if rail_side == "leftRail":
-            left_rails.append(annotation)
-        elif rail_side == "rightRail":
+            if _annotation_is_ego_track(annotation, scene):
+                left_rails.append(annotation)
+        elif rail_side == "rightRail" and _annotation_is_ego_track(annotation, scene):
             right_rails.append(annotation)
 
     return left_rails, right_rails
@@ -105,8 +105,12 @@ def _check_rail_issues(
     if not left_rails or not right_rails:
         return []
 
-    left_y_range = _get_y_range(left_rails)
-    right_y_range = _get_y_range(right_rails)
+    # The y-range of every rail is computed once and reused for the overlap check and the counts
+    left_rail_ranges = _get_rail_y_ranges(left_rails)
+    right_rail_ranges = _get_rail_y_ranges(right_rails)
+
+    left_y_range = _get_y_range(left_rail_ranges)
+    right_y_range = _get_y_range(right_rail_ranges)
 
     if left_y_range is None or right_y_range is None:
         return []
@@ -137,8 +141,8 @@ def _check_rail_issues(
     common_y = min(left_max, right_max)
 
     # Count rails at common_y
-    left_count_at_y = sum(1 for rail in left_rails if _y_in_poly2d(common_y, rail))
-    right_count_at_y = sum(1 for rail in right_rails if _y_in_poly2d(common_y, rail))
+    left_count_at_y = sum(1 for y_min, y_max in left_rail_ranges if y_min <= common_y <= y_max)
+    right_count_at_y = sum(1 for y_min, y_max in right_rail_ranges if y_min <= common_y <= y_max)
 
     if left_count_at_y != 1 or right_count_at_y != 1:
         issues.append(
@@ -165,39 +169,42 @@ def _annotation_is_ego_track(annotation: Poly2d, scene: raillabel.Scene) -> bool
     if object_data is None:
         return False
 
+    attributes = annotation.attributes
+
     # Check isEgoTrack attribute on the annotation (newer format)
-    if "isEgoTrack" in annotation.attributes:
-        return bool(annotation.attributes["isEgoTrack"])
+    if "isEgoTrack" in attributes:
+        return bool(attributes["isEgoTrack"])
 
     # Check trackID attribute for legacy ego track identifiers
-    track_id_keys = {"trackID", "trackId", "TrackID", "onTrack"}
-    track_id_ego_values = {0, "0", "ego_track"}
-
-    for key in track_id_keys:
-        if key in annotation.attributes:
-            track_id = annotation.attributes[key]
-            if track_id in track_id_ego_values:
-                return True
+    for key in _TRACK_ID_KEYS:
+        if key in attributes and attributes[key] in _TRACK_ID_EGO_VALUES:
+            return True
 
     return False
 
 
-def _get_y_range(rails: list[Poly2d]) -> tuple[float, float] | None:
-    """Get the min and max y values across all rails."""
-    if not rails:
-        return None
-
-    all_y_values = [point.y for rail in rails for point in rail.points]
+def _get_rail_y_ranges(rails: list[Poly2d]) -> list[tuple[float, float]]:
+    """Get the min and max y values of each rail, skipping rails without points."""
+    rail_ranges = []
+    for rail in rails:
+        if not rail.points:
+            continue
 
-    if not all_y_values:
+        # Track the min and max in a single pass, without building a list of all y values
+        y_min = y_max = rail.points[0].y
+        for point in rail.points:
+            y = point.y
+            if y < y_min:
+                y_min = y
+            elif y > y_max:
+                y_max = y
+        rail_ranges.append((y_min, y_max))
+    return rail_ranges
+
+
+def _get_y_range(rail_ranges: list[tuple[float, float]]) -> tuple[float, float] | None:
+    """Get the min and max y values across all rails from their individual y-ranges."""
+    if not rail_ranges:
         return None
 
-    return min(all_y_values), max(all_y_values)
-
-
-def _y_in_poly2d(y: float, poly2d: Poly2d) -> bool:
-    """Check if a y value falls within the y-range of a poly2d."""
-    y_values = [point.y for point in poly2d.points]
-    if not y_values:
-        return False
-    return min(y_values) <= y <= max(y_values)
+    return min(y_min for y_min, _ in rail_ranges), max(y_max for _, y_max in rail_ranges)
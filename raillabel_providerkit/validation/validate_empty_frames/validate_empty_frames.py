@@ -31,7 +31,14 @@ def validate_empty_frames(scene: raillabel.Scene) -> list[Issue]:
     # Get sensor IDs that require annotations (middle cameras + lidar)
     sensors_requiring_annotations = _get_sensors_requiring_annotations(scene.sensors)
 
+    if not sensors_requiring_annotations:
+        return errors
+
     for frame_uid, frame in scene.frames.items():
+        # Collect the annotated sensors in a single pass, instead of scanning all annotations
+        # once per sensor
+        annotated_sensor_ids = _get_annotated_sensor_ids(frame)
+
         # Check each sensor that requires annotations
         errors.extend(
             Issue(
@@ -40,7 +47,7 @@ def validate_empty_frames(scene: raillabel.Scene) -> list[Issue]:
                 reason="There are no annotations in this sensor frame.",
             )
             for sensor_id in sensors_requiring_annotations
-            if not _sensor_has_annotations_in_frame(sensor_id, frame)
+            if sensor_id not in annotated_sensor_ids
         )
 
     return errors
@@ -62,6 +69,6 @@ def _get_sensors_requiring_annotations(
     return sensor_ids
 
 
-def _sensor_has_annotations_in_frame(sensor_id: str, frame: raillabel.format.Frame) -> bool:
-    """Check if a sensor has any annotations in the given frame."""
-    return any(annotation.sensor_id == sensor_id for annotation in frame.annotations.values())
+def _get_annotated_sensor_ids(frame: raillabel.format.Frame) -> set[str | None]:
+    """Get the IDs of all sensors that have at least one annotation in the given frame."""
+    return {annotation.sensor_id for annotation in frame.annotations.values()}
@@ -2,3 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 """Package for validating a scene for annotations crossing the horizon."""
+
+from .validate_horizon import validate_horizon
+
+__all__ = ["validate_horizon"]
@@ -4,20 +4,18 @@
 """Validate that track/transition annotations are below the horizon line."""
 
 import raillabel
-from raillabel.filter import (
-    IncludeAnnotationTypeFilter,
-    IncludeObjectTypeFilter,
-    IncludeSensorTypeFilter,
-)
 from raillabel.format import (
     Camera,
     Poly2d,
 )
 
+from raillabel_providerkit._util import iter_annotations
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
 
 from ._horizon_calculator import _HorizonCalculator
 
+_HORIZON_OBJECT_TYPES = frozenset({"track", "transition"})
+
 
 def validate_horizon(
     scene: raillabel.Scene,
@@ -50,49 +48,46 @@ def validate_horizon(
     """
     issues = []
 
-    filtered_scene = scene.filter(
-        [
-            IncludeObjectTypeFilter(["track", "transition"]),
-            IncludeSensorTypeFilter(["camera"]),
-            IncludeAnnotationTypeFilter(["poly2d"]),
-        ]
-    )
-
-    for frame_uid, frame in filtered_scene.frames.items():
-        for annotation_uid, annotation in frame.annotations.items():
-            if not isinstance(annotation, Poly2d):
-                msg = f"Expected Poly2d annotation but got {type(annotation).__name__}"
-                raise TypeError(msg)
-
-            sensor_id = annotation.sensor_id
-
-            identifiers = IssueIdentifiers(
-                annotation=annotation_uid,
-                frame=frame_uid,
-                object=annotation.object_id,
-                object_type=filtered_scene.objects[annotation.object_id].type,
-                sensor=sensor_id,
-            )
-
-            sensor = filtered_scene.sensors[sensor_id]
-            if not isinstance(sensor, Camera):
-                continue
-
-            issues.extend(
-                _validate_annotation_for_horizon(
-                    annotation,
-                    sensor,
-                    identifiers,
-                    horizon_tolerance_percent,
-                )
+    # The horizon only depends on the camera, so it is calculated once per camera
+    horizon_y_by_sensor: dict[str, float] = {}
+
+    for frame_uid, annotation_uid, annotation in iter_annotations(scene, _HORIZON_OBJECT_TYPES):
+        if not isinstance(annotation, Poly2d):
+            continue
+
+        sensor_id = annotation.sensor_id
+        sensor = scene.sensors[sensor_id]
+        if not isinstance(sensor, Camera):
+            continue
+
+        identifiers = IssueIdentifiers(
+            annotation=annotation_uid,
+            frame=frame_uid,
+            object=annotation.object_id,
+            object_type=scene.objects[annotation.object_id].type,
+            sensor=sensor_id,
+        )
+
+        horizon_y = horizon_y_by_sensor.get(sensor_id)
+        if horizon_y is None:
+            horizon_y = _HorizonCalculator(sensor).calculate_horizon()
+            horizon_y_by_sensor[sensor_id] = horizon_y
+
+        issues.extend(
+            _validate_annotation_for_horizon(
+                annotation,
+                horizon_y,
+                identifiers,
+                horizon_tolerance_percent,
             )
+        )
 
     return issues
 
 
 def _validate_annotation_for_horizon(
     annotation: Poly2d,
-    camera: Camera,
+    horizon_y: float,
     identifiers: IssueIdentifiers,
     horizon_tolerance_percent: float = 10.0,
 ) -> list[Issue]:
@@ -102,8 +97,8 @@ def _validate_annotation_for_horizon(
     ----------
     annotation : Poly2d
         The polygon annotation to check.
-    camera : Camera
-        The camera sensor with calibration data.
+    horizon_y : float
+        The Y coordinate of the horizon line in the image of the annotation's camera.
     identifiers : IssueIdentifiers
         Identifiers for error reporting.
     horizon_tolerance_percent : float
@@ -114,21 +109,14 @@ def _validate_annotation_for_horizon(
     list[Issue]
         List containing one Issue if a point is above horizon, empty otherwise.
     """
-    horizon_calculator = _HorizonCalculator(camera)
-
-    # Calculate the horizon line (returns a function that gives Y for any X)
-    horizon_line_function = horizon_calculator.calculate_horizon()
+    # Apply tolerance buffer: move horizon line up by the tolerance percentage
+    # The horizon_y is measured from the top of the image (Y=0 is top)
+    # Moving it "up" means making it smaller (more permissive for tracks)
+    # We subtract an absolute amount based on abs(horizon_y) so the direction
+    # is always correct, even when horizon_y is negative or zero.
+    horizon_y_with_buffer = horizon_y - abs(horizon_y) * (horizon_tolerance_percent / 100.0)
 
     for point in annotation.points:
-        horizon_y = horizon_line_function(point.x)
-
-        # Apply tolerance buffer: move horizon line up by the tolerance percentage
-        # The horizon_y is measured from the top of the image (Y=0 is top)
-        # Moving it "up" means making it smaller (more permissive for tracks)
-        # We subtract an absolute amount based on abs(horizon_y) so the direction
-        # is always correct, even when horizon_y is negative or zero.
-        horizon_y_with_buffer = horizon_y - abs(horizon_y) * (horizon_tolerance_percent / 100.0)
-
         if point.y < horizon_y_with_buffer:
             return [
                 Issue(
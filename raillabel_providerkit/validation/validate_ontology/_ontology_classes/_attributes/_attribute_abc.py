@@ -14,6 +14,8 @@ from pkgutil import iter_modules
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
 from raillabel_providerkit.validation.validate_ontology._ontology_classes._scope import _Scope
 
+_DEFAULT_SENSOR_TYPES: tuple[str, ...] = ("camera", "lidar", "radar")
+
 
 @dataclass
 class _Attribute(abc.ABC):
@@ -25,13 +27,13 @@ class _Attribute(abc.ABC):
         Whether the attribute is required to exist in every annotation of the object class.
     scope: _Scope
         The scope all attributes following this definition have to adhere to.
-    sensor_types: list[str]
+    sensor_types: tuple[str, ...]
         The sensors for which annotations are allowed to have this attribute.
     """
 
     optional: bool
     scope: _Scope
-    sensor_types: list[str]
+    sensor_types: tuple[str, ...]
 
     @property
     @abc.abstractmethod
@@ -58,7 +60,7 @@ class _Attribute(abc.ABC):
         return cls(
             optional=attribute_dict.get("optional", False),
             scope=_Scope(attribute_dict.get("scope", "annotation")),
-            sensor_types=attribute_dict.get("sensor_types", ["camera", "lidar", "radar"]),
+            sensor_types=_sensor_types_fromdict(attribute_dict),
         )
 
     def check_type_and_value(
@@ -130,11 +132,32 @@ class _Attribute(abc.ABC):
         return []
 
 
+def _sensor_types_fromdict(attribute_dict: dict) -> tuple[str, ...]:
+    sensor_types = attribute_dict.get("sensor_types")
+    if sensor_types is None:
+        return _DEFAULT_SENSOR_TYPES
+    return tuple(sensor_types)
+
+
 def attribute_classes() -> list[type[_Attribute]]:
     """Return dictionary with Attribute child classes."""
     return ATTRIBUTE_CLASSES
 
 
+def attribute_class_for(attribute_dict: dict) -> type[_Attribute] | None:
+    """Return the Attribute child class supporting the definition or None if there is none."""
+    attribute_type = attribute_dict.get("attribute_type")
+    if isinstance(attribute_type, dict):
+        attribute_type = attribute_type.get("type")
+    if not isinstance(attribute_type, str):
+        return None
+
+    attribute_class = ATTRIBUTE_CLASSES_BY_TYPE.get(attribute_type)
+    if attribute_class is None or not attribute_class.supports(attribute_dict):
+        return None
+    return attribute_class
+
+
 def _collect_attribute_classes() -> None:
     """Collect attribute child classes and store them."""
     package_dir = str(Path(__file__).resolve().parent)
@@ -151,3 +174,7 @@ def _collect_attribute_classes() -> None:
 
 ATTRIBUTE_CLASSES: list[type[_Attribute]] = []
 _collect_attribute_classes()
+ATTRIBUTE_CLASSES_BY_TYPE: dict[str, type[_Attribute]] = {
+    class_.ATTRIBUTE_TYPE_IDENTIFIER: class_  # type: ignore[misc]
+    for class_ in ATTRIBUTE_CLASSES
+}
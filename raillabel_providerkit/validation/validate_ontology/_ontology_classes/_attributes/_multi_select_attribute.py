@@ -4,29 +4,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
 from raillabel_providerkit.validation.validate_ontology._ontology_classes._scope import (
     _Scope,
 )
 
-from ._attribute_abc import _Attribute
+from ._attribute_abc import _Attribute, _sensor_types_fromdict
 
 
 @dataclass
 class _MultiSelectAttribute(_Attribute):
-    options: set[str]
+    options: frozenset[str]
     ATTRIBUTE_TYPE_IDENTIFIER = "multi-select"
     PYTHON_TYPE = list
 
     @classmethod
     def supports(cls, attribute_dict: dict) -> bool:
-        return (
-            "attribute_type" in attribute_dict
-            and type(attribute_dict["attribute_type"]) is dict
-            and "type" in attribute_dict["attribute_type"]
-            and attribute_dict["attribute_type"]["type"] == cls.ATTRIBUTE_TYPE_IDENTIFIER
-        )
+        try:
+            return attribute_dict["attribute_type"]["type"] == cls.ATTRIBUTE_TYPE_IDENTIFIER
+        except (KeyError, TypeError):
+            # No attribute_type, or one that is not a mapping with a type (e.g. a plain string)
+            return False
 
     @classmethod
     def fromdict(cls, attribute_dict: dict) -> _MultiSelectAttribute:
@@ -36,8 +36,8 @@ class _MultiSelectAttribute(_Attribute):
         return _MultiSelectAttribute(
             optional=attribute_dict.get("optional", False),
             scope=_Scope(attribute_dict.get("scope", "annotation")),
-            sensor_types=attribute_dict.get("sensor_types", ["camera", "lidar", "radar"]),
-            options=set(attribute_dict["attribute_type"]["options"]),
+            sensor_types=_sensor_types_fromdict(attribute_dict),
+            options=frozenset(attribute_dict["attribute_type"]["options"]),
         )
 
     def check_type_and_value(
@@ -65,7 +65,7 @@ class _MultiSelectAttribute(_Attribute):
                             reason=(
                                 f"Attribute '{attribute_name}' has an undefined value"
                                 f" '{attribute_value}' (defined options:"
-                                f" {self._stringify_options()})."
+                                f" {self._options_str})."
                                 f" [FIXABLE] Did you mean '{suggested}'?"
                             ),
                             identifiers=identifiers,
@@ -78,7 +78,7 @@ class _MultiSelectAttribute(_Attribute):
                         type=IssueType.ATTRIBUTE_VALUE,
                         reason=(
                             f"Attribute '{attribute_name}' has an undefined value"
-                            f" '{attribute_value}' (defined options: {self._stringify_options()})."
+                            f" '{attribute_value}' (defined options: {self._options_str})."
                         ),
                         identifiers=identifiers,
                     )
@@ -109,16 +109,10 @@ class _MultiSelectAttribute(_Attribute):
             annotation_2_identifiers,
         )
 
-    def _stringify_options(self) -> str:
-        options_str = ""
-
-        for option in sorted(self.options):
-            options_str += f"'{option}', "
-
-        if options_str != "":
-            options_str = options_str[:-2]
-
-        return options_str
+    @cached_property
+    def _options_str(self) -> str:
+        # The options do not change after construction, so they are only stringified once
+        return ", ".join(f"'{option}'" for option in sorted(self.options))
 
     def _find_whitespace_match(self, value: str) -> str | None:
         """Find an option that matches the value when whitespace is normalized.
@@ -4,29 +4,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
 from raillabel_providerkit.validation.validate_ontology._ontology_classes._scope import (
     _Scope,
 )
 
-from ._attribute_abc import _Attribute
+from ._attribute_abc import _Attribute, _sensor_types_fromdict
 
 
 @dataclass
 class _SingleSelectAttribute(_Attribute):
-    options: set[str]
+    options: frozenset[str]
     ATTRIBUTE_TYPE_IDENTIFIER = "single-select"
     PYTHON_TYPE = str
 
     @classmethod
     def supports(cls, attribute_dict: dict) -> bool:
-        return (
-            "attribute_type" in attribute_dict
-            and type(attribute_dict["attribute_type"]) is dict
-            and "type" in attribute_dict["attribute_type"]
-            and attribute_dict["attribute_type"]["type"] == cls.ATTRIBUTE_TYPE_IDENTIFIER
-        )
+        try:
+            return attribute_dict["attribute_type"]["type"] == cls.ATTRIBUTE_TYPE_IDENTIFIER
+        except (KeyError, TypeError):
+            # No attribute_type, or one that is not a mapping with a type (e.g. a plain string)
+            return False
 
     @classmethod
     def fromdict(cls, attribute_dict: dict) -> _SingleSelectAttribute:
@@ -36,8 +36,8 @@ class _SingleSelectAttribute(_Attribute):
         return _SingleSelectAttribute(
             optional=attribute_dict.get("optional", False),
             scope=_Scope(attribute_dict.get("scope", "annotation")),
-            sensor_types=attribute_dict.get("sensor_types", ["camera", "lidar", "radar"]),
-            options=set(attribute_dict["attribute_type"]["options"]),
+            sensor_types=_sensor_types_fromdict(attribute_dict),
+            options=frozenset(attribute_dict["attribute_type"]["options"]),
         )
 
     def check_type_and_value(
@@ -46,6 +46,10 @@ class _SingleSelectAttribute(_Attribute):
         attribute_values: bool | float | str | list,
         identifiers: IssueIdentifiers,
     ) -> list[Issue]:
+        # Fast path for the common case of a valid option, which needs no type conversion
+        if type(attribute_values) is str and attribute_values in self.options:
+            return []
+
         # Convert numeric types (int/float) to string for comparison
         # This handles cases where data contains numeric values (e.g., 1.0, 2.0)
         # but the ontology defines string options (e.g., "1", "2")
@@ -74,7 +78,7 @@ class _SingleSelectAttribute(_Attribute):
                         type=IssueType.ATTRIBUTE_VALUE,
                         reason=(
                             f"Attribute '{attribute_name}' has an undefined value"
-                            f" '{attribute_values}' (defined options: {self._stringify_options()})."
+                            f" '{attribute_values}' (defined options: {self._options_str})."
                             f" [FIXABLE] Did you mean '{suggested}'?"
                         ),
                         identifiers=identifiers,
@@ -87,7 +91,7 @@ class _SingleSelectAttribute(_Attribute):
                     type=IssueType.ATTRIBUTE_VALUE,
                     reason=(
                         f"Attribute '{attribute_name}' has an undefined value"
-                        f" '{attribute_values}' (defined options: {self._stringify_options()})."
+                        f" '{attribute_values}' (defined options: {self._options_str})."
                     ),
                     identifiers=identifiers,
                 )
@@ -97,6 +101,11 @@ class _SingleSelectAttribute(_Attribute):
 
     def _all_options_are_numeric(self) -> bool:
         """Check if all options are numeric strings (e.g., '1', '2', '10')."""
+        return self._options_are_numeric
+
+    @cached_property
+    def _options_are_numeric(self) -> bool:
+        # The options do not change after construction, so they are only checked once
         return all(self._is_numeric_string(option) for option in self.options)
 
     @staticmethod
@@ -120,13 +129,7 @@ class _SingleSelectAttribute(_Attribute):
                 return option
         return None
 
-    def _stringify_options(self) -> str:
-        options_str = ""
-
-        for option in sorted(self.options):
-            options_str += f"'{option}', "
-
-        if options_str != "":
-            options_str = options_str[:-2]
-
-        return options_str
+    @cached_property
+    def _options_str(self) -> str:
+        # The options do not change after construction, so they are only stringified once
+        return ", ".join(f"'{option}'" for option in sorted(self.options))
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from raillabel_providerkit.validation import Issue, IssueType
 from raillabel_providerkit.validation.validate_ontology._ontology_classes._sensor_type import (
@@ -11,12 +11,15 @@ from raillabel_providerkit.validation.validate_ontology._ontology_classes._senso
 )
 
 from ._annotation_with_metadata import _AnnotationWithMetadata
-from ._attributes._attribute_abc import _Attribute, attribute_classes
+from ._attributes._attribute_abc import _Attribute, attribute_class_for
 
 
 @dataclass
 class _ObjectClass:
     attributes: dict[str, _Attribute]
+    _applicable_attributes_by_sensor_type: dict[_SensorType | None, dict[str, _Attribute]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def fromdict(cls, data: dict) -> _ObjectClass:
@@ -34,9 +37,9 @@ class _ObjectClass:
 
     @classmethod
     def _attribute_fromdict(cls, attribute: dict) -> _Attribute:
-        for attribute_class in attribute_classes():
-            if attribute_class.supports(attribute):
-                return attribute_class.fromdict(attribute)
+        attribute_class = attribute_class_for(attribute)
+        if attribute_class is not None:
+            return attribute_class.fromdict(attribute)
 
         msg = f"No attribute class supports definition: {attribute}"
         raise ValueError(msg)
@@ -44,13 +47,14 @@ class _ObjectClass:
     def _check_undefined_attributes(
         self, annotation_metadata: _AnnotationWithMetadata
     ) -> list[Issue]:
+        applicable_attributes = self._compile_applicable_attributes(annotation_metadata.sensor_type)
         return [
             Issue(
                 type=IssueType.ATTRIBUTE_UNDEFINED,
                 identifiers=annotation_metadata.to_identifiers(attr_name),
             )
             for attr_name in annotation_metadata.annotation.attributes
-            if attr_name not in self._compile_applicable_attributes(annotation_metadata.sensor_type)
+            if attr_name not in applicable_attributes
         ]
 
     def _check_missing_attributes(self, annotation_metadata: _AnnotationWithMetadata) -> list[Issue]:
@@ -87,10 +91,16 @@ class _ObjectClass:
 
     def _compile_applicable_attributes(
         self,
-        sensor_type: _SensorType,
+        sensor_type: _SensorType | None,
     ) -> dict[str, _Attribute]:
-        return {
-            attr_name: attr
-            for attr_name, attr in self.attributes.items()
-            if sensor_type in [_SensorType(sensor_type_str) for sensor_type_str in attr.sensor_types]
-        }
+        # The attributes do not change after loading, so they are only matched against the
+        # sensor_types once per sensor type. The returned dict is shared and must not be mutated.
+        applicable_attributes = self._applicable_attributes_by_sensor_type.get(sensor_type)
+        if applicable_attributes is None:
+            applicable_attributes = {
+                attr_name: attr
+                for attr_name, attr in self.attributes.items()
+                if sensor_type in attr.sensor_types
+            }
+            self._applicable_attributes_by_sensor_type[sensor_type] = applicable_attributes
+        return applicable_attributes
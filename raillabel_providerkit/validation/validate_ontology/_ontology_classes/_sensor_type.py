@@ -4,7 +4,7 @@
 from enum import Enum
 
 
-class _SensorType(Enum):
+class _SensorType(str, Enum):
     CAMERA = "camera"
     LIDAR = "lidar"
     RADAR = "radar"
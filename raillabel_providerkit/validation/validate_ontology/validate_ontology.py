@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 import jsonschema
@@ -36,13 +37,25 @@ def validate_ontology(scene: raillabel.Scene, ontology_input: dict | Path) -> li
 
     """
     if isinstance(ontology_input, Path):
-        ontology_input = _load_ontology(Path(ontology_input))
+        ontology = _load_prepared_ontology(
+            ontology_input.resolve(), ontology_input.stat().st_mtime_ns
+        )
+    else:
+        _validate_ontology_schema(ontology_input)
+        ontology = _Ontology.fromdict(ontology_input)
 
-    _validate_ontology_schema(ontology_input)
+    return ontology.check(scene)
 
-    ontology = _Ontology.fromdict(ontology_input)
 
-    return ontology.check(scene)
+@lru_cache(maxsize=8)
+def _load_prepared_ontology(path: Path, mtime_ns: int) -> _Ontology:  # noqa: ARG001
+    """Load, validate and parse an ontology file once and reuse it for later scenes.
+
+    The modification time is part of the cache key, so that changes to the file are picked up.
+    """
+    ontology_input = _load_ontology(path)
+    _validate_ontology_schema(ontology_input)
+    return _Ontology.fromdict(ontology_input)
 
 
 def _load_ontology(path: Path) -> dict:
@@ -50,13 +63,18 @@ def _load_ontology(path: Path) -> dict:
         return yaml.safe_load(f)
 
 
-def _validate_ontology_schema(ontology: dict) -> None:
+@lru_cache(maxsize=1)
+def _get_ontology_schema_validator() -> jsonschema.Draft7Validator:
     schema_path = get_schema_path("ontology")
 
     with schema_path.open() as f:
         ontology_schema = yaml.safe_load(f)
 
-    validator = jsonschema.Draft7Validator(schema=ontology_schema)
+    return jsonschema.Draft7Validator(schema=ontology_schema)
+
+
+def _validate_ontology_schema(ontology: dict) -> None:
+    validator = _get_ontology_schema_validator()
 
     schema_errors = ""
     for error in validator.iter_errors(ontology):
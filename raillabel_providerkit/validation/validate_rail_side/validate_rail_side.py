@@ -16,6 +16,11 @@ from raillabel.filter import (
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
 
+# The filters are stateless, so the ones that do not depend on the camera are shared.
+_CAMERA_FILTER = IncludeSensorTypeFilter(["camera"])
+_TRACK_OBJECT_FILTER = IncludeObjectTypeFilter(["track", "transition"])
+_POLY2D_FILTER = IncludeAnnotationTypeFilter(["poly2d"])
+
 
 def validate_rail_side(scene: raillabel.Scene) -> list[Issue]:
     """Validate whether all tracks have <= one left and right rail, and that they have correct order.
@@ -34,15 +39,11 @@ def validate_rail_side(scene: raillabel.Scene) -> list[Issue]:
     """
     errors = []
 
-    camera_uids = list(scene.filter([IncludeSensorTypeFilter(["camera"])]).sensors.keys())
+    camera_uids = list(scene.filter([_CAMERA_FILTER]).sensors.keys())
 
     for camera_uid in camera_uids:
         filtered_scene = scene.filter(
-            [
-                IncludeObjectTypeFilter(["track", "transition"]),
-                IncludeSensorIdFilter([camera_uid]),
-                IncludeAnnotationTypeFilter(["poly2d"]),
-            ]
+            [_TRACK_OBJECT_FILTER, IncludeSensorIdFilter([camera_uid]), _POLY2D_FILTER]
         )
 
         for frame_uid, frame in filtered_scene.frames.items():
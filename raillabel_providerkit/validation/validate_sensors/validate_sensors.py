@@ -6,6 +6,8 @@ import raillabel
 from raillabel_providerkit._util import SENSOR_METADATA
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
 
+_UNKNOWN_SENSOR_ID_REASON = f"Supported sensor ids: {list(SENSOR_METADATA.keys())}"
+
 
 def validate_sensors(scene: raillabel.Scene) -> list[Issue]:
     """Validate whether whether all sensors have supported names and have the correct type.
@@ -36,7 +38,7 @@ def _validate_sensor_ids(scene: raillabel.Scene) -> list[Issue]:
             Issue(
                 type=IssueType.SENSOR_ID_UNKNOWN,
                 identifiers=IssueIdentifiers(sensor=sensor_id),
-                reason=f"Supported sensor ids: {list(SENSOR_METADATA.keys())}",
+                reason=_UNKNOWN_SENSOR_ID_REASON,
             )
         )
 
@@ -47,11 +49,8 @@ def _validate_sensor_types(scene: raillabel.Scene) -> list[Issue]:
     issues = []
 
     for sensor_id, sensor in scene.sensors.items():
-        if sensor_id not in SENSOR_METADATA:
-            continue
-
-        expected_type = SENSOR_METADATA[sensor_id]
-        if isinstance(sensor, expected_type):
+        expected_type = SENSOR_METADATA.get(sensor_id)
+        if expected_type is None or isinstance(sensor, expected_type):
             continue
 
         issues.append(
@@ -4,8 +4,8 @@
 from __future__ import annotations
 
 import raillabel
-from raillabel.filter import IncludeObjectTypeFilter
 
+from raillabel_providerkit._util import iter_annotations
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
 
 
@@ -27,30 +27,27 @@ def validate_transition(scene: raillabel.Scene) -> list[Issue]:
     """
     issues = []
 
-    # Filter scene for transition objects only
-    filtered_scene = scene.filter([IncludeObjectTypeFilter(["transition"])])
-
-    for frame_id, frame in filtered_scene.frames.items():
-        for annotation_id, annotation in frame.annotations.items():
-            # Get startTrack and endTrack attributes
-            start_track = annotation.attributes.get("startTrack", None)
-            end_track = annotation.attributes.get("endTrack", None)
-
-            # Flag issue if startTrack == endTrack and both are not None
-            if start_track == end_track and start_track is not None:
-                reason = f"This transition's startTrack and endTrack are identical: {start_track}."
-                issues.append(
-                    Issue(
-                        type=IssueType.TRANSITION_IDENTICAL_START_END,
-                        identifiers=IssueIdentifiers(
-                            annotation=annotation_id,
-                            frame=frame_id,
-                            object=annotation.object_id,
-                            sensor=annotation.sensor_id,
-                            attribute="startTrack",
-                        ),
-                        reason=reason,
-                    )
-                )
+    for frame_id, annotation_id, annotation in iter_annotations(scene, ("transition",)):
+        # Flag issue if startTrack == endTrack and both are not None. The cheap None check
+        # comes first, so endTrack is only looked up for transitions that have a startTrack.
+        attributes = annotation.attributes
+        start_track = attributes.get("startTrack")
+        if start_track is None or attributes.get("endTrack") != start_track:
+            continue
+
+        reason = f"This transition's startTrack and endTrack are identical: {start_track}."
+        issues.append(
+            Issue(
+                type=IssueType.TRANSITION_IDENTICAL_START_END,
+                identifiers=IssueIdentifiers(
+                    annotation=annotation_id,
+                    frame=frame_id,
+                    object=annotation.object_id,
+                    sensor=annotation.sensor_id,
+                    attribute="startTrack",
+                ),
+                reason=reason,
+            )
+        )
 
     return issues
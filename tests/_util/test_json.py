@@ -0,0 +1,42 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+import io
+import json
+
+import pytest
+from raillabel_providerkit._util import _json
+from raillabel_providerkit._util._json import to_json_bytes, write_json_array
+
+
+def test_returns_bytes():
+    assert isinstance(to_json_bytes([]), bytes)
+
+
+def test_round_trip():
+    data = [{"type": "SchemaIssue", "identifiers": ["frames", 1], "reason": "lorem ipsum"}]
+    assert json.loads(to_json_bytes(data)) == data
+
+
+def test_indented_like_stdlib():
+    data = [{"type": "EmptyFrameIssue", "identifiers": {"frame": 1}}]
+    assert to_json_bytes(data).decode() == json.dumps(data, indent=2)
+
+
+def test_fallback_without_orjson(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_json, "_HAS_ORJSON", False)
+    data = {"a": [1, 2], "b": None}
+    assert to_json_bytes(data) == json.dumps(data, indent=2).encode()
+
+
+def test_write_json_array_matches_to_json_bytes():
+    data = [{"type": "SchemaIssue", "identifiers": ["frames", 1]}, {"type": "EmptyFrameIssue"}]
+    file = io.BytesIO()
+    write_json_array(file, (to_json_bytes(item) for item in data))
+    assert file.getvalue() == to_json_bytes(data)
+
+
+def test_write_json_array_empty():
+    file = io.BytesIO()
+    write_json_array(file, [])
+    assert file.getvalue() == to_json_bytes([])
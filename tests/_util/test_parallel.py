@@ -0,0 +1,19 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from raillabel_providerkit._util import pool_chunksize
+
+
+@pytest.mark.parametrize(
+    ("num_tasks", "max_workers", "expected"),
+    [
+        (0, 4, 1),
+        (3, 4, 1),
+        (64, 4, 4),
+        (10_000, 4, 8),
+    ],
+)
+def test_pool_chunksize(num_tasks, max_workers, expected):
+    assert pool_chunksize(num_tasks, max_workers) == expected
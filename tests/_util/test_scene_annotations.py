@@ -0,0 +1,57 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+from uuid import UUID
+
+import pytest
+from raillabel.scene_builder import SceneBuilder
+
+from raillabel_providerkit._util import iter_annotations
+
+
+@pytest.fixture
+def scene():
+    return (
+        SceneBuilder.empty()
+        .add_object(object_type="track", object_name="track_0001")
+        .add_object(object_type="transition", object_name="transition_0001")
+        .add_object(object_type="person", object_name="person_0001")
+        .add_poly2d(
+            uid=UUID("00000000-0000-0000-0000-000000000001"), frame_id=1, object_name="track_0001"
+        )
+        .add_poly2d(
+            uid=UUID("00000000-0000-0000-0000-000000000002"),
+            frame_id=1,
+            object_name="transition_0001",
+        )
+        .add_bbox(
+            uid=UUID("00000000-0000-0000-0000-000000000003"), frame_id=2, object_name="person_0001"
+        )
+        .result
+    )
+
+
+def test_all_annotations(scene):
+    actual = [(frame_id, annotation_id) for frame_id, annotation_id, _ in iter_annotations(scene)]
+    assert actual == [
+        (1, UUID("00000000-0000-0000-0000-000000000001")),
+        (1, UUID("00000000-0000-0000-0000-000000000002")),
+        (2, UUID("00000000-0000-0000-0000-000000000003")),
+    ]
+
+
+def test_object_types(scene):
+    actual = [annotation_id for _, annotation_id, _ in iter_annotations(scene, ("track", "person"))]
+    assert actual == [
+        UUID("00000000-0000-0000-0000-000000000001"),
+        UUID("00000000-0000-0000-0000-000000000003"),
+    ]
+
+
+def test_yields_the_scene_annotations(scene):
+    _, annotation_id, annotation = next(iter_annotations(scene, ("transition",)))
+    assert annotation is scene.frames[1].annotations[annotation_id]
+
+
+def test_no_matching_object_type(scene):
+    assert list(iter_annotations(scene, ("signal",))) == []
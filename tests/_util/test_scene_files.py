@@ -0,0 +1,44 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+import pytest
+from raillabel_providerkit._util import iter_scene_files
+
+
+def test_finds_nested_scenes(tmp_path):
+    (tmp_path / "sub" / "subsub").mkdir(parents=True)
+    (tmp_path / "a.json").touch()
+    (tmp_path / "sub" / "b.json").touch()
+    (tmp_path / "sub" / "subsub" / "c.json").touch()
+
+    assert sorted(iter_scene_files(tmp_path)) == [
+        tmp_path / "a.json",
+        tmp_path / "sub" / "b.json",
+        tmp_path / "sub" / "subsub" / "c.json",
+    ]
+
+
+def test_ignores_other_files(tmp_path):
+    (tmp_path / "a.json").touch()
+    (tmp_path / "b.yaml").touch()
+    (tmp_path / "c.json.bak").touch()
+
+    assert list(iter_scene_files(tmp_path)) == [tmp_path / "a.json"]
+
+
+def test_ignores_hidden_folders(tmp_path):
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / "sub" / ".hidden").mkdir(parents=True)
+    (tmp_path / ".hidden" / "a.json").touch()
+    (tmp_path / "sub" / ".hidden" / "b.json").touch()
+    (tmp_path / "sub" / "c.json").touch()
+
+    assert list(iter_scene_files(tmp_path)) == [tmp_path / "sub" / "c.json"]
+
+
+def test_empty_folder(tmp_path):
+    assert list(iter_scene_files(tmp_path)) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-vv"])
@@ -1,17 +1,19 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: MIT
 
-import os
 import pathlib
+import sys
 
 import pytest
 
 # Executes the test
-os.system("clear")
-pytest.main(
-    [
-        str(pathlib.Path(__file__).parent),
-        "--disable-pytest-warnings",
-        "--cache-clear",
-    ]
-)
+if __name__ == "__main__":
+    sys.exit(
+        pytest.main(
+            [
+                str(pathlib.Path(__file__).parent),
+                "--disable-pytest-warnings",
+                "--cache-clear",
+            ]
+        )
+    )
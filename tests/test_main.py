@@ -0,0 +1,198 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+import pytest
+import raillabel
+import yaml
+from click.testing import CliRunner
+from raillabel.scene_builder import SceneBuilder
+
+import raillabel_providerkit.__main__ as main_module
+from raillabel_providerkit.__main__ import (
+    _atomic_open,
+    _atomic_open_binary,
+    _iter_validation_results,
+    _ValidationSummary,
+    cli,
+)
+from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+
+
+def test_atomic_open__writes_file(tmp_path):
+    filepath = tmp_path / "issues.csv"
+    with _atomic_open(filepath, "w") as file:
+        file.write("content")
+
+    assert filepath.read_text() == "content"
+    assert list(tmp_path.iterdir()) == [filepath]
+
+
+def test_atomic_open__removes_part_file_on_error(tmp_path):
+    filepath = tmp_path / "issues.csv"
+    filepath.write_text("previous")
+
+    with pytest.raises(RuntimeError), _atomic_open(filepath, "w") as file:
+        file.write("partial")
+        raise RuntimeError
+
+    assert filepath.read_text() == "previous"
+    assert list(tmp_path.iterdir()) == [filepath]
+
+
+def test_atomic_open_binary__writes_file(tmp_path):
+    filepath = tmp_path / "issues.json"
+    with _atomic_open_binary(filepath) as file:
+        file.write(b"[]")
+
+    assert filepath.read_bytes() == b"[]"
+
+
+@pytest.fixture
+def scene_folder(tmp_path):
+    folder = tmp_path / "scenes"
+    folder.mkdir()
+    raillabel.save(SceneBuilder.empty().result, folder / "clean.json")
+    raillabel.save(
+        SceneBuilder.empty().add_sensor("rgb_center").add_frame(1).result, folder / "faulty.json"
+    )
+    return folder
+
+
+def test_validate__skip_empty(scene_folder, tmp_path):
+    output_folder = tmp_path / "output"
+
+    result = CliRunner().invoke(
+        cli, ["validate", str(scene_folder), str(output_folder), "-q", "-j1", "--skip-empty"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert sorted(path.name for path in output_folder.iterdir()) == ["faulty.issues.json"]
+
+
+def test_validate__skip_empty_removes_stale_issue_files(scene_folder, tmp_path):
+    output_folder = tmp_path / "output"
+    output_folder.mkdir()
+    (output_folder / "clean.issues.json").write_text('[{"type": "EmptyFrameIssue"}]')
+    (output_folder / "clean.issues.csv").write_text("stale")
+
+    result = CliRunner().invoke(
+        cli, ["validate", str(scene_folder), str(output_folder), "-q", "-j1", "--skip-empty"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert sorted(path.name for path in output_folder.iterdir()) == ["faulty.issues.json"]
+
+
+@pytest.fixture
+def many_scenes_folder(tmp_path):
+    folder = tmp_path / "many_scenes"
+    folder.mkdir()
+    for num_frames in range(6):
+        builder = SceneBuilder.empty().add_sensor("rgb_center").add_sensor("lidar")
+        for frame_id in range(1, num_frames + 1):
+            builder = builder.add_frame(frame_id)
+        raillabel.save(builder.result, folder / f"scene_{num_frames}.json")
+    return folder
+
+
+def test_iter_validation_results__parallel_keeps_order(many_scenes_folder):
+    scene_files = sorted(many_scenes_folder.iterdir(), reverse=True)
+
+    sequential = list(_iter_validation_results(scene_files, None, 10.0, fix=False, jobs=1))
+    parallel = list(_iter_validation_results(scene_files, None, 10.0, fix=False, jobs=2))
+
+    assert [scene_path for scene_path, _, _ in parallel] == scene_files
+    assert any(issues for _, issues, _ in parallel)
+    assert parallel == sequential
+
+
+def test_iter_validation_results__single_job_runs_in_process(many_scenes_folder, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("no process pool expected")
+
+    monkeypatch.setattr(main_module, "ProcessPoolExecutor", fail)
+    scene_files = sorted(many_scenes_folder.iterdir())
+
+    results = list(_iter_validation_results(scene_files, None, 10.0, fix=False, jobs=1))
+
+    assert [scene_path for scene_path, _, _ in results] == scene_files
+
+
+def test_validate__parallel_output_matches_sequential(many_scenes_folder, tmp_path):
+    outputs = {}
+    for jobs in ("1", "2"):
+        output_folder = tmp_path / f"output_{jobs}"
+        result = CliRunner().invoke(
+            cli,
+            ["validate", str(many_scenes_folder), str(output_folder), "--use-csv", "-j", jobs],
+        )
+        assert result.exit_code == 0, result.output
+        outputs[jobs] = {path.name: path.read_bytes() for path in output_folder.iterdir()}
+
+    assert len(outputs["1"]) == 12
+    assert outputs["2"] == outputs["1"]
+
+
+def test_validation_summary__add():
+    summary = _ValidationSummary()
+    summary.add([])
+    summary.add(
+        [
+            Issue(IssueType.ATTRIBUTE_UNDEFINED, IssueIdentifiers(attribute="x")),
+            Issue(IssueType.ATTRIBUTE_UNDEFINED, IssueIdentifiers(attribute="x")),
+            Issue(IssueType.ATTRIBUTE_VALUE, IssueIdentifiers(attribute="y"), fixable=True),
+            Issue(IssueType.EMPTY_FRAMES, IssueIdentifiers(frame=1)),
+        ]
+    )
+
+    assert summary.scenes_with_issues == 1
+    assert summary.total_issues == 4
+    assert summary.fixable_count == 1
+    assert summary.issue_type_counter == {
+        IssueType.ATTRIBUTE_UNDEFINED.value: 2,
+        IssueType.ATTRIBUTE_VALUE.value: 1,
+        IssueType.EMPTY_FRAMES.value: 1,
+    }
+    assert summary.attribute_details == {
+        IssueType.ATTRIBUTE_UNDEFINED.value: {"x": 2},
+        IssueType.ATTRIBUTE_VALUE.value: {"y": 1},
+    }
+
+
+def test_validate__top_k_truncates_attribute_details(tmp_path):
+    scene_folder = tmp_path / "scenes"
+    scene_folder.mkdir()
+    scene = (
+        SceneBuilder.empty()
+        .add_object(object_type="person", object_name="person_0001")
+        .add_bbox(
+            frame_id=1,
+            object_name="person_0001",
+            attributes={"first": True, "second": True, "third": True},
+        )
+        .result
+    )
+    raillabel.save(scene, scene_folder / "scene.json")
+    ontology = tmp_path / "ontology.yaml"
+    ontology.write_text(yaml.safe_dump({"person": {}}))
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "validate",
+            str(scene_folder),
+            str(tmp_path / "output"),
+            "--ontology",
+            str(ontology),
+            "-j1",
+            "--top-k",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    details = result.output.split("Attribute details:")[1]
+    assert "1x first" in details
+    assert "1x second" in details
+    assert "third" not in details
+    assert "... 1 more" in details
@@ -3,13 +3,22 @@
 
 """Tests for the ontologies manager module."""
 
+from functools import cache
 from pathlib import Path
 
 import pytest
+import yaml
 
 from raillabel_providerkit.ontologies import get_ontology_path, list_available_ontologies
 
 
+@cache
+def _load_ontology(name: str) -> dict:
+    """Parse a bundled ontology once per test session; callers must not mutate the result."""
+    with get_ontology_path(name).open() as f:
+        return yaml.safe_load(f)
+
+
 class TestListAvailableOntologies:
     """Tests for list_available_ontologies function."""
 
@@ -67,12 +76,12 @@ class TestGetOntologyPath:
         path = get_ontology_path("osdar26")
         assert "ontologies" in str(path)
 
-    def test_all_ontologies_accessible(self):
+    @pytest.mark.parametrize("ontology", list_available_ontologies())
+    def test_all_ontologies_accessible(self, ontology):
         """Test that all listed ontologies can be accessed."""
-        for ontology in list_available_ontologies():
-            path = get_ontology_path(ontology)
-            assert path.exists()
-            assert path.is_file()
+        path = get_ontology_path(ontology)
+        assert path.exists()
+        assert path.is_file()
 
 
 class TestOntologyContent:
@@ -80,21 +89,13 @@ class TestOntologyContent:
 
     def test_osdar26_valid_yaml(self):
         """Test that OSDAR26 ontology is valid YAML."""
-        import yaml
-
-        path = get_ontology_path("osdar26")
-        with path.open() as f:
-            data = yaml.safe_load(f)
+        data = _load_ontology("osdar26")
         assert isinstance(data, dict)
         assert len(data) > 0
 
     def test_osdar26_has_expected_classes(self):
         """Test that OSDAR26 has expected classes."""
-        import yaml
-
-        path = get_ontology_path("osdar26")
-        with path.open() as f:
-            data = yaml.safe_load(f)
+        data = _load_ontology("osdar26")
 
         # Check for some key classes
         expected_classes = [
@@ -111,21 +112,13 @@ class TestOntologyContent:
 
     def test_automatedtrain_valid_yaml(self):
         """Test that AutomatedTrain ontology is valid YAML."""
-        import yaml
-
-        path = get_ontology_path("automatedtrain")
-        with path.open() as f:
-            data = yaml.safe_load(f)
+        data = _load_ontology("automatedtrain")
         assert isinstance(data, dict)
         assert len(data) > 0
 
     def test_automatedtrain_has_safety_critical_classes(self):
         """Test that AutomatedTrain has safety-critical classes."""
-        import yaml
-
-        path = get_ontology_path("automatedtrain")
-        with path.open() as f:
-            data = yaml.safe_load(f)
+        data = _load_ontology("automatedtrain")
 
         # Check for safety-critical classes
         safety_classes = ["track", "signal", "buffer_stop", "switch"]
@@ -134,11 +127,7 @@ class TestOntologyContent:
 
     def test_osdar23_valid_yaml(self):
         """Test that OSDAR23 ontology is valid YAML."""
-        import yaml
-
-        path = get_ontology_path("osdar23")
-        with path.open() as f:
-            data = yaml.safe_load(f)
+        data = _load_ontology("osdar23")
         assert isinstance(data, dict)
         assert len(data) > 0
 
@@ -146,18 +135,12 @@ class TestOntologyContent:
 class TestOntologyIntegration:
     """Integration tests for ontology usage with validation."""
 
-    def test_ontology_can_be_used_with_validate(self):
+    @pytest.mark.parametrize("ontology_name", list_available_ontologies())
+    def test_ontology_can_be_used_with_validate(self, ontology_name):
         """Test that ontology can be loaded by validation system."""
         from raillabel_providerkit.validation.validate_ontology.validate_ontology import (
             _validate_ontology_schema,
         )
 
-        import yaml
-
-        for ontology_name in list_available_ontologies():
-            path = get_ontology_path(ontology_name)
-            with path.open() as f:
-                ontology_data = yaml.safe_load(f)
-
-            # Should not raise any exceptions
-            _validate_ontology_schema(ontology_data)
+        # Should not raise any exceptions
+        _validate_ontology_schema(_load_ontology(ontology_name))
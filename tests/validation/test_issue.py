@@ -1,6 +1,8 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: MIT
 
+import json
+
 import jsonschema.exceptions
 import pytest
 from uuid import UUID
@@ -8,6 +10,11 @@ from uuid import UUID
 import jsonschema
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation.issue import ISSUES_SCHEMA
+
+
+def test_issues_schema_is_valid():
+    jsonschema.Draft202012Validator.check_schema(ISSUES_SCHEMA)
 
 
 def test_issue_identifiers_serialize__empty():
@@ -177,6 +184,15 @@ def test_issue_serialize__schema_error():
     }
 
 
+def test_issue_serialize_json_bytes():
+    issue = Issue(
+        IssueType.SCHEMA,
+        ["this", "is", "some", "schema", "error", 73],
+        "some reason",
+    )
+    assert json.loads(issue.serialize_json_bytes()) == issue.serialize()
+
+
 def test_issue_deserialize__simple():
     serialized = {
         "type": "AttributeMissing",
@@ -258,5 +274,55 @@ def test_issue_deserialize__invalid_identifiers_type():
         )
 
 
+def test_issue_to_row__simple():
+    issue = Issue(
+        type=IssueType.ATTRIBUTE_MISSING,
+        identifiers=IssueIdentifiers(
+            annotation=UUID("f9b8aa82-e42b-43df-85fb-99ab51145732"),
+            attribute="likes_trains",
+            frame=0,
+            object=UUID("6caf0a36-3872-4368-8d88-801593c7bc24"),
+            object_type="person",
+            sensor="rgb_center",
+        ),
+        reason="some reason",
+    )
+    assert issue.to_row() == (
+        "AttributeMissing",
+        0,
+        "rgb_center",
+        "person",
+        "6caf0a36-3872-4368-8d88-801593c7bc24",
+        "f9b8aa82-e42b-43df-85fb-99ab51145732",
+        "likes_trains",
+        "",
+        "some reason",
+    )
+
+
+def test_issue_to_row__empty_identifiers_and_no_reason():
+    issue = Issue(type=IssueType.EMPTY_FRAMES, identifiers=IssueIdentifiers())
+    assert issue.to_row() == ("EmptyFramesIssue", "", "", "", "", "", "", "", "")
+
+
+def test_issue_to_row__schema_error():
+    issue = Issue(
+        type=IssueType.SCHEMA,
+        identifiers=["this", "is", "some", "schema", "error", 73],
+        reason="some reason",
+    )
+    assert issue.to_row() == (
+        "SchemaIssue",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "['this', 'is', 'some', 'schema', 'error', 73]",
+        "some reason",
+    )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
@@ -7,6 +7,7 @@ from typing import Dict, Optional, List
 from uuid import uuid4
 
 import pytest
+from raillabel.format import Cuboid, Point3d, Quaternion, Size3d
 
 from raillabel_providerkit.validation.issue import IssueType
 from raillabel_providerkit.validation.validate_annotation_type_per_sensor import (
@@ -109,3 +110,22 @@ def test_missing_sensor_binding_is_ignored():
         frames={3: _Frame(annotations={"a": ann})},
     )
     assert validate_annotation_type_per_sensor(scene) == []
+
+
+def test_raillabel_annotation_sensor_id_is_used():
+    cuboid = Cuboid(
+        pos=Point3d(0, 0, 0),
+        quat=Quaternion(0, 0, 0, 1),
+        size=Size3d(0, 0, 0),
+        object_id=uuid4(),
+        sensor_id="cam0",
+        attributes={},
+    )
+    scene = _Scene(
+        sensors={"cam0": _Sensor(id="cam0", type="camera")},
+        frames={4: _Frame(annotations={"a": cuboid})},
+    )
+    issues = validate_annotation_type_per_sensor(scene)
+    assert len(issues) == 1
+    assert issues[0].identifiers.annotation_type == "Cuboid"
+    assert issues[0].identifiers.sensor == "cam0"
@@ -8,14 +8,17 @@ import raillabel
 from raillabel.format import Camera, Lidar, Bbox, Poly3d, Point2d, Size2d, Point3d, IntrinsicsPinhole
 
 from raillabel_providerkit.validation.validate_empty_frames.validate_empty_frames import (
+    _get_annotated_sensor_ids,
     _get_sensors_requiring_annotations,
-    _sensor_has_annotations_in_frame,
     validate_empty_frames,
 )
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
 
+_OBJECT_UUID = UUID("7df959d7-0ec2-4722-8b62-bb2e529de2ec")
+_ANNOTATION_UUID = UUID("0fb4fc0b-3eeb-443a-8dd0-2caf9912d016")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def middle_camera():
     return Camera(
         intrinsics=IntrinsicsPinhole(
@@ -30,7 +33,7 @@ def middle_camera():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def lidar_sensor():
     return Lidar(
         extrinsics=None,
@@ -39,10 +42,10 @@ def lidar_sensor():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_bbox():
     return Bbox(
-        object_id=UUID("7df959d7-0ec2-4722-8b62-bb2e529de2ec"),
+        object_id=_OBJECT_UUID,
         sensor_id="rgb_center",
         pos=Point2d(0.0, 0.0),
         size=Size2d(10.0, 10.0),
@@ -50,10 +53,10 @@ def sample_bbox():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_poly3d():
     return Poly3d(
-        object_id=UUID("7df959d7-0ec2-4722-8b62-bb2e529de2ec"),
+        object_id=_OBJECT_UUID,
         sensor_id="lidar",
         points=[Point3d(0, 0, 0), Point3d(1, 1, 1)],
         closed=False,
@@ -96,46 +99,55 @@ def test_get_sensors_requiring_annotations__lidar_included(lidar_sensor):
     assert "lidar" in result
 
 
-def test_sensor_has_annotations_in_frame__no_annotations():
+def test_get_annotated_sensor_ids__no_annotations():
     frame = raillabel.format.Frame(timestamp=None, sensors={}, frame_data={}, annotations={})
-    assert not _sensor_has_annotations_in_frame("rgb_center", frame)
+    assert _get_annotated_sensor_ids(frame) == set()
+
+
+def test_get_annotated_sensor_ids__has_annotations(sample_bbox):
+    frame = raillabel.format.Frame(
+        timestamp=None,
+        sensors={},
+        frame_data={},
+        annotations={_ANNOTATION_UUID: sample_bbox},
+    )
+    assert "rgb_center" in _get_annotated_sensor_ids(frame)
 
 
-def test_sensor_has_annotations_in_frame__has_annotations(sample_bbox):
+def test_get_annotated_sensor_ids__annotations_for_other_sensor(sample_bbox):
     frame = raillabel.format.Frame(
         timestamp=None,
         sensors={},
         frame_data={},
-        annotations={UUID("0fb4fc0b-3eeb-443a-8dd0-2caf9912d016"): sample_bbox},
+        annotations={_ANNOTATION_UUID: sample_bbox},
     )
-    assert _sensor_has_annotations_in_frame("rgb_center", frame)
+    assert "lidar" not in _get_annotated_sensor_ids(frame)
 
 
-def test_sensor_has_annotations_in_frame__annotations_for_other_sensor(sample_bbox):
+def test_get_annotated_sensor_ids__multiple_sensors(sample_bbox, sample_poly3d):
     frame = raillabel.format.Frame(
         timestamp=None,
         sensors={},
         frame_data={},
-        annotations={UUID("0fb4fc0b-3eeb-443a-8dd0-2caf9912d016"): sample_bbox},
+        annotations={
+            _ANNOTATION_UUID: sample_bbox,
+            UUID("f1c1e8a1-3f7e-4b1e-9a3e-2d1c5b7a9e01"): sample_poly3d,
+        },
     )
-    assert not _sensor_has_annotations_in_frame("lidar", frame)
+    assert _get_annotated_sensor_ids(frame) == {"rgb_center", "lidar"}
 
 
 def test_validate_empty_frames__no_error(middle_camera, sample_bbox):
     scene = raillabel.Scene(
         metadata=raillabel.format.Metadata(schema_version="1.0.0"),
         sensors={"rgb_center": middle_camera},
-        objects={
-            UUID("7df959d7-0ec2-4722-8b62-bb2e529de2ec"): raillabel.format.Object(
-                name="obj", type="person"
-            )
-        },
+        objects={_OBJECT_UUID: raillabel.format.Object(name="obj", type="person")},
         frames={
             0: raillabel.format.Frame(
                 timestamp=None,
                 sensors={},
                 frame_data={},
-                annotations={UUID("0fb4fc0b-3eeb-443a-8dd0-2caf9912d016"): sample_bbox},
+                annotations={_ANNOTATION_UUID: sample_bbox},
             ),
         },
     )
@@ -1,6 +1,8 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: MIT
 
+import math
+
 import pytest
 from raillabel.format import Camera, IntrinsicsPinhole, Point3d, Quaternion, Transform
 
@@ -76,39 +78,45 @@ def test_horizon_calculator__no_intrinsics():
         _HorizonCalculator(camera)
 
 
-def test_horizon_calculator__returns_callable():
-    """Test that calculate_horizon returns a callable function."""
+def test_horizon_calculator__returns_float():
+    """Test that calculate_horizon returns the horizon Y coordinate."""
     camera = _create_simple_camera()
     calc = _HorizonCalculator(camera)
 
-    horizon_fn = calc.calculate_horizon()
-
-    # Should be callable and return a float
-    result = horizon_fn(960)
-    assert isinstance(result, float)
+    assert isinstance(calc.calculate_horizon(), float)
 
 
-def test_horizon_calculator__horizon_is_horizontal():
-    """Test that horizon line is horizontal (same Y for all X)."""
+def test_horizon_calculator__pitch_property_exists():
+    """Test that pitch_degrees property exists and returns a float."""
     camera = _create_simple_camera()
     calc = _HorizonCalculator(camera)
 
-    horizon_fn = calc.calculate_horizon()
+    assert isinstance(calc.pitch_degrees, float)
 
-    # Horizon should return same Y for all X values
-    y_left = horizon_fn(0)
-    y_center = horizon_fn(960)
-    y_right = horizon_fn(1920)
 
-    assert y_left == y_center == y_right
+def test_horizon_calculator__pitch_from_quaternion():
+    """Test that the pitch is derived from a rotation around the camera's x-axis."""
+    # A rotation by 100 degrees around the x-axis tilts the optical axis 10 degrees down
+    half_angle = math.radians(100) / 2
+    camera = _create_simple_camera(quat=(math.sin(half_angle), 0.0, 0.0, math.cos(half_angle)))
 
+    assert _HorizonCalculator(camera).pitch_degrees == pytest.approx(10.0)
 
-def test_horizon_calculator__pitch_property_exists():
-    """Test that pitch_degrees property exists and returns a float."""
-    camera = _create_simple_camera()
-    calc = _HorizonCalculator(camera)
 
-    assert isinstance(calc.pitch_degrees, float)
+def test_horizon_calculator__unnormalized_quaternion():
+    """Test that the quaternion is normalized before deriving the pitch."""
+    quat = (0.5448, -0.5400, 0.4494, -0.4578)
+    calc = _HorizonCalculator(_create_simple_camera(quat=quat))
+    calc_scaled = _HorizonCalculator(_create_simple_camera(quat=tuple(3 * v for v in quat)))
+
+    assert calc.pitch_degrees == pytest.approx(calc_scaled.pitch_degrees)
+
+
+def test_horizon_calculator__zero_quaternion():
+    """Test that calculator raises error when the quaternion has no rotation information."""
+    camera = _create_simple_camera(quat=(0.0, 0.0, 0.0, 0.0))
+    with pytest.raises(ValueError, match="quaternion"):
+        _HorizonCalculator(camera)
 
 
 def test_horizon_calculator__inclination_moves_horizon():
@@ -116,8 +124,8 @@ def test_horizon_calculator__inclination_moves_horizon():
     camera = _create_simple_camera()
     calc = _HorizonCalculator(camera)
 
-    horizon_no_incl = calc.calculate_horizon(inclination=0.0)(960)
-    horizon_with_incl = calc.calculate_horizon(inclination=0.1)(960)
+    horizon_no_incl = calc.calculate_horizon(inclination=0.0)
+    horizon_with_incl = calc.calculate_horizon(inclination=0.1)
 
     # Positive inclination should move horizon (exact direction depends on camera orientation)
     assert horizon_no_incl != horizon_with_incl
@@ -156,8 +164,7 @@ def test_horizon_calculator__realistic_quaternion():
     )
     calc = _HorizonCalculator(camera)
 
-    horizon_fn = calc.calculate_horizon()
-    horizon_y = horizon_fn(2736)
+    horizon_y = calc.calculate_horizon()
 
     # Horizon should return a valid float
     assert isinstance(horizon_y, float)
@@ -0,0 +1,63 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: MIT
+
+import math
+
+from raillabel.format import Camera, IntrinsicsPinhole, Point2d, Point3d, Quaternion, Transform
+from raillabel.scene_builder import SceneBuilder
+
+from raillabel_providerkit.validation import IssueType
+from raillabel_providerkit.validation.validate_horizon.validate_horizon import validate_horizon
+
+
+def _create_tilted_camera() -> Camera:
+    """Create a camera tilted 10 degrees down, with its horizon at Y=~363.7."""
+    half_angle = math.radians(100) / 2
+    return Camera(
+        extrinsics=Transform(
+            pos=Point3d(x=0.0, y=0.0, z=2.0),
+            quat=Quaternion(x=math.sin(half_angle), y=0.0, z=0.0, w=math.cos(half_angle)),
+        ),
+        intrinsics=IntrinsicsPinhole(
+            camera_matrix=(1000.0, 0.0, 960.0, 0.0, 0.0, 1000.0, 540.0, 0.0, 0.0, 0.0, 1.0, 0.0),
+            distortion=(0.0, 0.0, 0.0, 0.0, 0.0),
+            width_px=1920,
+            height_px=1080,
+        ),
+        uri=None,
+        description=None,
+    )
+
+
+def _build_scene(object_name: str, points: list[tuple[float, float]]):
+    scene = (
+        SceneBuilder.empty()
+        .add_poly2d(
+            frame_id=1,
+            points=[Point2d(x=x, y=y) for x, y in points],
+            object_name=object_name,
+            sensor_id="rgb_middle",
+        )
+        .result
+    )
+    scene.sensors["rgb_middle"] = _create_tilted_camera()
+    return scene
+
+
+def test_validate_horizon__track_below_horizon():
+    scene = _build_scene("track_0001", [(960, 800), (960, 1000)])
+    assert validate_horizon(scene) == []
+
+
+def test_validate_horizon__track_above_horizon():
+    scene = _build_scene("track_0001", [(960, 800), (960, 100)])
+    issues = validate_horizon(scene)
+    assert len(issues) == 1
+    assert issues[0].type == IssueType.HORIZON_CROSSED
+    assert issues[0].identifiers.object_type == "track"
+    assert issues[0].identifiers.sensor == "rgb_middle"
+
+
+def test_validate_horizon__other_object_types_ignored():
+    scene = _build_scene("person_0001", [(960, 100)])
+    assert validate_horizon(scene) == []
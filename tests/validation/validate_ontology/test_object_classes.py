@@ -103,6 +103,16 @@ def test_fromdict__vector_attributes():
     }
 
 
+def test_fromdict__unsupported_attribute_type():
+    with pytest.raises(ValueError):
+        _ObjectClass.fromdict({"carries": {"attribute_type": "unknown"}})
+
+
+def test_fromdict__select_attribute_type_without_options_mapping():
+    with pytest.raises(ValueError):
+        _ObjectClass.fromdict({"carries": {"attribute_type": "single-select"}})
+
+
 def test_check__correct():
     object_class = _ObjectClass.fromdict({"isPeelable": {"attribute_type": "boolean"}})
     annotation_metadata = build_bbox_with_attributes({"isPeelable": True})
@@ -194,5 +204,13 @@ def test_compile_applicable_attributes__matching(example_boolean_attribute_dict)
     assert "test_attribute" in object_class._compile_applicable_attributes(_SensorType.CAMERA)
 
 
+def test_compile_applicable_attributes__per_sensor_type(example_boolean_attribute_dict):
+    example_boolean_attribute_dict["sensor_types"] = ["camera"]
+    object_class = _ObjectClass.fromdict({"test_attribute": example_boolean_attribute_dict})
+    camera_attributes = object_class._compile_applicable_attributes(_SensorType.CAMERA)
+    assert object_class._compile_applicable_attributes(_SensorType.CAMERA) is camera_attributes
+    assert object_class._compile_applicable_attributes(_SensorType.LIDAR) == {}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
@@ -4,6 +4,7 @@
 """Tests for the OSDAR26 ontology file."""
 
 import pytest
+from functools import cache
 from pathlib import Path
 import yaml
 import jsonschema
@@ -17,14 +18,16 @@ OSDAR26_ONTOLOGY_PATH = Path(__file__).parent.parent.parent / "__assets__" / "os
 ONTOLOGY_SCHEMA_PATH = get_schema_path("ontology")
 
 
+@cache
 def _load_ontology(ontology_path: Path) -> dict:
-    """Load and return the ontology as a dictionary."""
+    """Load and return the ontology as a dictionary (parsed once, must not be mutated)."""
     with ontology_path.open("r") as f:
         return yaml.safe_load(f)
 
 
+@cache
 def _load_schema(schema_path: Path) -> dict:
-    """Load and return the schema as a dictionary."""
+    """Load and return the schema as a dictionary (parsed once, must not be mutated)."""
     with schema_path.open("r") as f:
         return yaml.safe_load(f)
 
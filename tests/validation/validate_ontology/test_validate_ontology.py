@@ -1,6 +1,7 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: MIT
 
+import os
 import pytest
 from pathlib import Path
 from uuid import UUID
@@ -8,6 +9,7 @@ from uuid import UUID
 from raillabel_providerkit.validation.validate_ontology.validate_ontology import (
     validate_ontology,
     _load_ontology,
+    _load_prepared_ontology,
 )
 from raillabel_providerkit.validation import IssueType
 from raillabel.scene_builder import SceneBuilder
@@ -85,6 +87,35 @@ def test_load_ontology__osdar23():
     assert isinstance(ontology_dict, dict)
 
 
+def test_validate_ontology__path_is_only_parsed_once(tmp_path):
+    ontology_path = tmp_path / "ontology.yaml"
+    ontology_path.write_text("banana:\n  is_peelable:\n    attribute_type: boolean\n")
+    scene = SceneBuilder.empty().add_bbox(object_name="banana_0001").result
+
+    validate_ontology(scene, ontology_path)
+    cache_info_before = _load_prepared_ontology.cache_info()
+    validate_ontology(scene, ontology_path)
+    cache_info_after = _load_prepared_ontology.cache_info()
+
+    assert cache_info_after.hits == cache_info_before.hits + 1
+    assert cache_info_after.misses == cache_info_before.misses
+
+
+def test_validate_ontology__path_changes_are_picked_up(tmp_path):
+    ontology_path = tmp_path / "ontology.yaml"
+    ontology_path.write_text("banana: {}\n")
+    scene = SceneBuilder.empty().add_bbox(object_name="apple_0001").result
+    issues_before = validate_ontology(scene, ontology_path)
+
+    ontology_path.write_text("apple: {}\n")
+    stat = ontology_path.stat()
+    os.utime(ontology_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    issues_after = validate_ontology(scene, ontology_path)
+
+    assert [issue.type for issue in issues_before] == [IssueType.OBJECT_TYPE_UNDEFINED]
+    assert issues_after == []
+
+
 def test_unexpected_class(example_ontology_dict):
     scene = SceneBuilder.empty().add_bbox(object_name="apple_0001").result
 